@@ -0,0 +1,32 @@
+"""Index de statut et de purge sur scraping_tasks
+
+Revision ID: task_status_indexes
+Revises: initial_state
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'task_status_indexes'
+down_revision = 'initial_state'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    """Index composite (status, created_at) et index partiel des tâches terminées"""
+    # IF NOT EXISTS : create_tables() crée déjà ces index sur une base neuve
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_scraping_tasks_status_created "
+        "ON scraping_tasks (status, created_at)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_scraping_tasks_cleanup "
+        "ON scraping_tasks (created_at) "
+        "WHERE status IN ('completed', 'failed', 'cancelled', 'timeout')"
+    )
+
+def downgrade():
+    """Suppression des index"""
+    op.execute("DROP INDEX IF EXISTS ix_scraping_tasks_cleanup")
+    op.execute("DROP INDEX IF EXISTS ix_scraping_tasks_status_created")
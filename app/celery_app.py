@@ -11,32 +11,82 @@ from celery.signals import worker_ready, task_prerun, task_postrun, task_failure
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sérialiseur orjson pour les messages et résultats (optionnel)
+try:
+    import orjson
+    from kombu.serialization import register as register_serializer
+    
+    def _orjson_dumps(obj) -> str:
+        # Pas de default= : un argument ou résultat non JSON échoue à la publication,
+        # comme avec le sérialiseur json (la conversion reste dans make_json_serializable)
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    register_serializer(
+        'orjson', _orjson_dumps, orjson.loads,
+        content_type='application/x-orjson', content_encoding='utf-8'
+    )
+    ORJSON_SERIALIZER_AVAILABLE = True
+except ImportError:
+    ORJSON_SERIALIZER_AVAILABLE = False
+
+# Intervalle (secondes) des diagnostics planifiés par celery beat
+DIAGNOSTICS_INTERVAL_SECONDS = float(os.getenv('CELERY_DIAGNOSTICS_INTERVAL', '3600'))
+
+# Intervalle (secondes) de la purge des tâches terminées anciennes
+CLEANUP_INTERVAL_SECONDS = float(os.getenv('CELERY_CLEANUP_INTERVAL', '86400'))
+
 def create_celery_app() -> Celery:
     """Créer l'application Celery avec configuration intelligente"""
     
     # Configuration Redis avec fallbacks
     redis_url = os.getenv('REDIS_URL', 'redis://redis:6379/0')
     
+    # Sérialisation : orjson si disponible ('json' reste accepté pour les messages en transit)
+    serializer = 'orjson' if ORJSON_SERIALIZER_AVAILABLE else 'json'
+    
     # Configuration Celery optimisée
     celery_config = {
         'broker_url': redis_url,
         'result_backend': redis_url,
-        'task_serializer': 'json',
-        'accept_content': ['json'],
-        'result_serializer': 'json',
+        'task_serializer': serializer,
+        'accept_content': ['json', 'orjson'] if ORJSON_SERIALIZER_AVAILABLE else ['json'],
+        'result_accept_content': ['json', 'orjson'] if ORJSON_SERIALIZER_AVAILABLE else ['json'],
+        'result_serializer': serializer,
         'timezone': 'Africa/Tunis',
         'enable_utc': True,
         
-        # Queues intelligentes
+        # Queues intelligentes : le scraping n'attend jamais derrière les diagnostics
         'task_routes': {
-            'app.tasks.scraping_tasks.smart_scrape_task': {'queue': 'scraping'},
-            'app.tasks.scraping_tasks.smart_health_check': {'queue': 'monitoring'},
+            'app.tasks.scraping_tasks.smart_scraping_task': {'queue': 'scraping'},
+            'app.tasks.scraping_tasks.scrape_url_task': {'queue': 'scraping'},
+            'app.tasks.scraping_tasks.finalize_scraping_task': {'queue': 'scraping'},
+            'app.tasks.scraping_tasks.scraping_chord_error_task': {'queue': 'scraping'},
+            'app.tasks.scraping_tasks.cleanup_old_tasks_task': {'queue': 'diagnostics'},
+            'app.tasks.scraping_tasks.health_check_task': {'queue': 'diagnostics'},
+            'app.tasks.scraping_tasks.coordinator_status_task': {'queue': 'diagnostics'},
+            'test_langgraph_workflow': {'queue': 'diagnostics'},
             'app.celery_app.smart_test_task': {'queue': 'testing'},
         },
         
-        # Performance optimisée
+        # Diagnostics et maintenance périodiques (celery beat) : worker de la queue diagnostics
+        'beat_schedule': {
+            'langgraph-workflow-diagnostics': {
+                'task': 'test_langgraph_workflow',
+                'schedule': DIAGNOSTICS_INTERVAL_SECONDS,
+                'options': {'queue': 'diagnostics', 'expires': DIAGNOSTICS_INTERVAL_SECONDS},
+            },
+            'cleanup-old-tasks': {
+                'task': 'app.tasks.scraping_tasks.cleanup_old_tasks_task',
+                'schedule': CLEANUP_INTERVAL_SECONDS,
+                'options': {'queue': 'diagnostics', 'expires': CLEANUP_INTERVAL_SECONDS},
+            },
+        },
+        
+        # Performance optimisée (tâches dominées par l'I/O réseau : concurrence > nombre de CPU)
+        'worker_concurrency': int(os.getenv('CELERY_WORKER_CONCURRENCY', '8')),
         'worker_prefetch_multiplier': 1,
         'task_acks_late': True,
+        'task_reject_on_worker_lost': True,
         'worker_max_tasks_per_child': 1000,
         'task_time_limit': 300,  # 5 minutes
         'task_soft_time_limit': 240,  # 4 minutes
@@ -109,11 +159,19 @@ def worker_ready_handler(sender=None, **kwargs):
 def task_prerun_handler(sender=None, task_id=None, task=None, args=None, kwargs=None, **kwds):
     """Avant exécution de tâche"""
     logger.debug(f"🔄 Démarrage tâche: {task.name} [{task_id}]")
+    
+    # Session DB à portée de tâche : réutilisée par toutes les écritures de la tâche
+    from app.models.database import TaskSession
+    TaskSession()
 
 @task_postrun.connect
 def task_postrun_handler(sender=None, task_id=None, task=None, args=None, kwargs=None, retval=None, state=None, **kwds):
     """Après exécution de tâche"""
     logger.debug(f"✅ Tâche terminée: {task.name} [{task_id}] - État: {state}")
+    
+    # Restitution de la connexion au pool en fin de tâche
+    from app.models.database import TaskSession
+    TaskSession.remove()
 
 @task_failure.connect
 def task_failure_handler(sender=None, task_id=None, exception=None, einfo=None, **kwds):
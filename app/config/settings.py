@@ -171,6 +171,8 @@ class Settings(BaseSettings):
     TASK_SOFT_TIME_LIMIT: int = Field(660, env="TASK_SOFT_TIME_LIMIT")
     WORKER_MAX_TASKS_PER_CHILD: int = Field(50, env="WORKER_MAX_TASKS_PER_CHILD")  # Réduit
     WORKER_PREFETCH_MULTIPLIER: int = Field(1, env="WORKER_PREFETCH_MULTIPLIER")
+    # Nombre d'URLs à partir duquel une tâche est répartie en chord (une sous-tâche par URL)
+    CHORD_URL_THRESHOLD: int = Field(5, env="CHORD_URL_THRESHOLD")
     
     # Configuration de performance
     PERFORMANCE_TRACKING: bool = Field(True, env="PERFORMANCE_TRACKING")
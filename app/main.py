@@ -7,6 +7,7 @@ import uuid
 import logging
 from datetime import datetime
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 import asyncio
 import aiohttp
@@ -22,6 +23,7 @@ from app.models.schemas import (
 from app.models.database import get_db, ScrapingTask, test_database_connection, init_database
 from app.celery_app import test_celery_connection, celery_app
 from app.config.settings import settings
+from app.utils.task_progress import get_progress
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,6 +38,28 @@ async def validate_url_accessibility(url: str, timeout: int = 10) -> bool:
         logger.debug(f"URL validation failed for {url}: {e}")
         return False  # Ne pas bloquer, juste signaler
 
+# Indicateurs constants des réponses de tâche (construits une fois)
+_COORDINATOR_INSIGHTS = {
+    "intelligent_coordination": True,
+    "automatic_strategy_selection": True,
+    "performance_optimization": True,
+    "tunisian_optimization": True,
+    "critical_corrections_applied": True,
+    "timeout_security": True
+}
+
+def _ordered_results(results: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Résultats dans l'ordre des URLs (ajoutés en base dans l'ordre de complétion)"""
+    if not results:
+        return []
+    return sorted(results, key=lambda result: result.get("url_index", 0) if isinstance(result, dict) else 0)
+
+@lru_cache(maxsize=1)
+def get_api_coordinator():
+    """Coordinateur unique du processus API (construit à la première utilisation)"""
+    from app.agents.smart_coordinator import SmartScrapingCoordinator
+    return SmartScrapingCoordinator()
+
 @asynccontextmanager
 async def smart_lifespan(app: FastAPI):
     """Gestionnaire intelligent du cycle de vie"""
@@ -89,8 +113,7 @@ app.add_middleware(
 async def smart_health_check():
     """Endpoint de vérification de santé intelligent"""
     try:
-        from app.agents.smart_coordinator import SmartScrapingCoordinator
-        coordinator = SmartScrapingCoordinator()
+        coordinator = get_api_coordinator()
         
         return HealthCheck(
             healthy=True,
@@ -186,6 +209,7 @@ async def create_smart_scraping_task(
                 "enable_llm_analysis": request.enable_llm_analysis,
                 "quality_threshold": validation['normalized_params']['quality_threshold'],
                 "timeout": validation['normalized_params']['timeout'],
+                "concurrency": request.concurrency,
                 "coordinator_mode": "smart_automatic_corrected",
                 "validation_warnings": validation_warnings,
                 "corrections_applied": [
@@ -204,33 +228,45 @@ async def create_smart_scraping_task(
         db.refresh(task)
         
         # CORRECTION 4: Envoi à Celery avec timeouts de sécurité CRITIQUES
-        from app.tasks.scraping_tasks import smart_scraping_task
+        from app.tasks.scraping_tasks import smart_scraping_task, dispatch_scraping_chord
         
         # Calcul intelligent des timeouts
         base_timeout = validation['normalized_params']['timeout']
         num_urls = len(validation['normalized_params']['urls'])
         total_timeout = min(base_timeout * num_urls, 600)  # Max 10 minutes
         
-        celery_result = smart_scraping_task.apply_async(
-            kwargs={
-                'task_id': task_id,
-                'urls': validation['normalized_params']['urls'],
-                'enable_llm_analysis': request.enable_llm_analysis,
-                'quality_threshold': validation['normalized_params']['quality_threshold'],
-                'timeout': base_timeout,
-                'callback_url': request.callback_url,
-                'priority': validation['normalized_params']['priority']
-            },
-            # TIMEOUTS DE SÉCURITÉ CRITIQUES
-            time_limit=total_timeout + 60,      # Timeout dur
-            soft_time_limit=total_timeout + 30,  # Warning timeout
-            expires=total_timeout + 120         # Expiration si pas exécuté
-        )
+        use_chord = num_urls >= settings.CHORD_URL_THRESHOLD
+        if use_chord:
+            # Gros lot : une sous-tâche par URL, réparties sur tous les workers
+            # (la ligne est passée en 'running' par dispatch_scraping_chord)
+            celery_result = dispatch_scraping_chord(
+                task_id,
+                validation['normalized_params']['urls'],
+                enable_llm_analysis=request.enable_llm_analysis,
+                quality_threshold=validation['normalized_params']['quality_threshold'],
+                timeout=base_timeout
+            )
+        else:
+            celery_result = smart_scraping_task.apply_async(
+                kwargs={
+                    'task_id': task_id,
+                    'urls': validation['normalized_params']['urls'],
+                    'enable_llm_analysis': request.enable_llm_analysis,
+                    'quality_threshold': validation['normalized_params']['quality_threshold'],
+                    'timeout': base_timeout,
+                    'callback_url': request.callback_url,
+                    'priority': validation['normalized_params']['priority'],
+                    'concurrency': request.concurrency
+                },
+                # TIMEOUTS DE SÉCURITÉ CRITIQUES
+                time_limit=total_timeout + 60,      # Timeout dur
+                soft_time_limit=total_timeout + 30,  # Warning timeout
+                expires=total_timeout + 120         # Expiration si pas exécuté
+            )
         
-        # Mise à jour avec l'ID du worker
-        task.status = TaskStatus.RUNNING.value
+        # Mise à jour avec l'ID du worker ; le statut reste 'pending' jusqu'à la prise
+        # en charge par le worker (_claim_task), qui seule passe la tâche en 'running'
         task.worker_id = celery_result.id
-        task.started_at = datetime.utcnow()
         db.commit()
         
         logger.info(f"Smart task created CORRECTED: {task_id} -> worker: {celery_result.id} (timeout: {total_timeout}s)")
@@ -241,7 +277,7 @@ async def create_smart_scraping_task(
         
         return TaskCreateResponse(
             task_id=task_id,
-            status=TaskStatus.RUNNING,
+            status=TaskStatus.RUNNING if use_chord else TaskStatus.PENDING,
             message=response_message,
             coordinator_mode="smart_automatic_corrected",
             intelligence_activated=True
@@ -266,17 +302,22 @@ async def get_smart_task_status(task_id: str, db = Depends(get_db)):
         if not task:
             raise HTTPException(status_code=404, detail="Tâche non trouvée")
         
+        # Tâche en cours : compteur live Redis, colonne progress (écrite par intervalles) sinon
+        progress = task.progress
+        if task.status == TaskStatus.RUNNING.value:
+            progress = get_progress(task_id) or progress
+        
         # Construction de la réponse avec intelligence
         response = TaskResponse(
             task_id=task.task_id,
             status=TaskStatus(task.status),
             progress=ProgressInfo(
-                current=task.progress.get("current", 0) if task.progress else 0,
-                total=task.progress.get("total", 1) if task.progress else 1,
-                percentage=task.progress.get("percentage", 0.0) if task.progress else 0.0,
-                display=task.progress.get("display", "0/1") if task.progress else "0/1"
+                current=progress.get("current", 0) if progress else 0,
+                total=progress.get("total", 1) if progress else 1,
+                percentage=progress.get("percentage", 0.0) if progress else 0.0,
+                display=progress.get("display", "0/1") if progress else "0/1"
             ),
-            results=task.results or [],
+            results=_ordered_results(task.results),
             created_at=task.created_at,
             started_at=task.started_at,
             completed_at=task.completed_at,
@@ -286,14 +327,7 @@ async def get_smart_task_status(task_id: str, db = Depends(get_db)):
             ai_enhanced=task.parameters.get("enable_llm_analysis", False) if task.parameters else False,
             metrics=task.metrics or {},
             strategy_used="smart_automatic_corrected",
-            coordinator_insights={
-                "intelligent_coordination": True,
-                "automatic_strategy_selection": True,
-                "performance_optimization": True,
-                "tunisian_optimization": True,
-                "critical_corrections_applied": True,
-                "timeout_security": True
-            }
+            coordinator_insights=_COORDINATOR_INSIGHTS
         )
         
         return response
@@ -332,33 +366,30 @@ async def get_tasks_by_status(
         # Construction des réponses
         responses = []
         for task in tasks:
+            # Colonnes JSON lues une fois par tâche
+            progress = task.progress or {}
+            llm_enabled = (task.parameters or {}).get("enable_llm_analysis", False)
+            
             response = TaskResponse(
                 task_id=task.task_id,
-                status=TaskStatus(task.status),
+                status=status or TaskStatus(task.status),
                 progress=ProgressInfo(
-                    current=task.progress.get("current", 0) if task.progress else 0,
-                    total=task.progress.get("total", 1) if task.progress else 1,
-                    percentage=task.progress.get("percentage", 0.0) if task.progress else 0.0,
-                    display=task.progress.get("display", "0/1") if task.progress else "0/1"
+                    current=progress.get("current", 0),
+                    total=progress.get("total", 1),
+                    percentage=progress.get("percentage", 0.0),
+                    display=progress.get("display", "0/1")
                 ),
-                results=task.results or [],
+                results=_ordered_results(task.results),
                 created_at=task.created_at,
                 started_at=task.started_at,
                 completed_at=task.completed_at,
                 error=task.error,
                 urls=task.urls or [],
-                llm_analysis_enabled=task.parameters.get("enable_llm_analysis", False) if task.parameters else False,
-                ai_enhanced=task.parameters.get("enable_llm_analysis", False) if task.parameters else False,
+                llm_analysis_enabled=llm_enabled,
+                ai_enhanced=llm_enabled,
                 metrics=task.metrics or {},
                 strategy_used="smart_automatic_corrected",
-                coordinator_insights={
-                    "intelligent_coordination": True,
-                    "automatic_strategy_selection": True,
-                    "performance_optimization": True,
-                    "tunisian_optimization": True,
-                    "critical_corrections_applied": True,
-                    "timeout_security": True
-                }
+                coordinator_insights=_COORDINATOR_INSIGHTS
             )
             responses.append(response)
         
@@ -412,8 +443,7 @@ async def cancel_smart_task(task_id: str, db = Depends(get_db)):
 async def debug_coordinator():
     """Endpoint de debug pour le coordinateur"""
     try:
-        from app.agents.smart_coordinator import SmartScrapingCoordinator
-        coordinator = SmartScrapingCoordinator()
+        coordinator = get_api_coordinator()
         
         # Test de fonctionnalité
         test_result = coordinator.test_coordinator_functionality()
@@ -438,8 +468,7 @@ async def test_safe_urls():
     ]
     
     try:
-        from app.agents.smart_coordinator import SmartScrapingCoordinator
-        coordinator = SmartScrapingCoordinator()
+        coordinator = get_api_coordinator()
         
         results = {}
         for url in safe_urls:
@@ -533,9 +562,7 @@ async def test_langgraph_endpoint():
 async def quick_langgraph_test():
     """Test rapide LangGraph sans Celery"""
     try:
-        from app.agents.smart_coordinator import SmartScrapingCoordinator
-        
-        coordinator = SmartScrapingCoordinator()
+        coordinator = get_api_coordinator()
         
         if hasattr(coordinator, 'scrape_with_langgraph'):
             test_url = "https://httpbin.org/json"
@@ -8,15 +8,37 @@ import logging
 import uuid
 from typing import Optional, Generator, Dict, Any, List
 from contextlib import contextmanager
-from sqlalchemy import create_engine, text, Column, Integer, String, DateTime, Text, JSON, Float
+from sqlalchemy import create_engine, text, Column, Integer, String, DateTime, Text, JSON, Float, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.exc import SQLAlchemyError
-from datetime import datetime
+from datetime import datetime, timedelta
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Options orjson des colonnes JSON : clés non textuelles, scalaires NumPy, dates naïves en UTC
+_ORJSON_COLUMN_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+) if ORJSON_AVAILABLE else 0
+
+def _orjson_serializer(obj: Any) -> str:
+    """Encodage JSON des colonnes JSON en C (résultats de scraping volumineux)"""
+    return orjson.dumps(obj, default=str, option=_ORJSON_COLUMN_OPTIONS).decode('utf-8')
+
+# Statuts comptés comme tâches actives
+ACTIVE_TASK_STATUSES = ('pending', 'running')
+
+# Statuts terminaux purgeables et taille des lots de suppression
+FINISHED_TASK_STATUSES = ('completed', 'failed', 'cancelled', 'timeout')
+CLEANUP_BATCH_SIZE = 5000
+
 # Base pour les modèles
 Base = declarative_base()
 
@@ -33,6 +55,9 @@ class SmartDatabaseConfig:
         self.pool_timeout = 30
         self.pool_recycle = 3600
         
+        # Cache des requêtes compilées (UPDATE de progression répétés par les workers)
+        self.query_cache_size = 1200
+        
         logger.info(f"Smart database config initialized: {self._mask_url(self.database_url)}")
 
     def _build_database_url(self) -> str:
@@ -58,6 +83,13 @@ class SmartDatabaseConfig:
 
     def create_engine(self):
         """Créer le moteur SQLAlchemy optimisé"""
+        json_options = {}
+        if ORJSON_AVAILABLE:
+            json_options = {
+                'json_serializer': _orjson_serializer,
+                'json_deserializer': orjson.loads
+            }
+        
         return create_engine(
             self.database_url,
             poolclass=QueuePool,
@@ -66,7 +98,9 @@ class SmartDatabaseConfig:
             pool_timeout=self.pool_timeout,
             pool_recycle=self.pool_recycle,
             pool_pre_ping=True,
-            echo=False
+            query_cache_size=self.query_cache_size,
+            echo=False,
+            **json_options
         )
 
 # Instance globale
@@ -74,9 +108,23 @@ db_config = SmartDatabaseConfig()
 engine = db_config.create_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Session à portée de tâche Celery (une par thread, libérée par le signal task_postrun)
+TaskSession = scoped_session(
+    sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
+)
+
 class ScrapingTask(Base):
     """Modèle unifié pour les tâches de scraping intelligent"""
     __tablename__ = "scraping_tasks"
+    __table_args__ = (
+        # Filtres par statut et période (statistiques, listes)
+        Index("ix_scraping_tasks_status_created", "status", "created_at"),
+        # Purge des tâches terminées (cleanup_old_tasks)
+        Index(
+            "ix_scraping_tasks_cleanup", "created_at",
+            postgresql_where=text("status IN ('completed', 'failed', 'cancelled', 'timeout')")
+        ),
+    )
     
     # Colonnes principales
     id = Column(Integer, primary_key=True, index=True)
@@ -387,15 +435,16 @@ def get_database_status() -> Dict[str, Any]:
                 status["tables_exist"] = table_check.fetchone()[0]
                 
                 if status["tables_exist"]:
-                    # Compter les tâches
-                    total_count = connection.execute(text("SELECT COUNT(*) FROM scraping_tasks"))
-                    status["total_tasks"] = total_count.fetchone()[0]
-                    
-                    active_count = connection.execute(text("""
-                        SELECT COUNT(*) FROM scraping_tasks 
-                        WHERE status IN ('pending', 'running')
-                    """))
-                    status["active_tasks"] = active_count.fetchone()[0]
+                    # Compteurs par statut en un seul aller-retour (total et actives dérivés)
+                    status_counts = dict(connection.execute(text("""
+                        SELECT status, COUNT(*) FROM scraping_tasks 
+                        GROUP BY status
+                    """)).fetchall())
+                    status["total_tasks"] = sum(status_counts.values())
+                    status["active_tasks"] = sum(
+                        status_counts.get(name, 0) for name in ACTIVE_TASK_STATUSES
+                    )
+                    status["status_counts"] = status_counts
         
         return status
         
@@ -403,6 +452,36 @@ def get_database_status() -> Dict[str, Any]:
         logger.error(f"Failed to get database status: {e}")
         return {"connection": False, "error": str(e)}
 
+def cleanup_old_tasks(older_than_days: int = 30, batch_size: int = CLEANUP_BATCH_SIZE) -> Dict[str, Any]:
+    """Purge des tâches terminées anciennes par lots de clés primaires.
+    
+    Chaque lot est validé séparément : les verrous restent brefs et la purge
+    peut être interrompue sans perdre les lots déjà supprimés.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    deleted_count = 0
+    
+    try:
+        with get_db_session() as db:
+            while True:
+                ids = [row[0] for row in db.query(ScrapingTask.id).filter(
+                    ScrapingTask.created_at < cutoff,
+                    ScrapingTask.status.in_(FINISHED_TASK_STATUSES)
+                ).limit(batch_size).all()]
+                if not ids:
+                    break
+                
+                db.query(ScrapingTask).filter(ScrapingTask.id.in_(ids)).delete(synchronize_session=False)
+                db.commit()
+                deleted_count += len(ids)
+        
+        logger.info(f"Cleanup removed {deleted_count} tasks older than {older_than_days} days")
+        return {"deleted_count": deleted_count, "cutoff": cutoff.isoformat()}
+        
+    except Exception as e:
+        logger.error(f"Task cleanup failed after {deleted_count} deletions: {e}")
+        return {"deleted_count": deleted_count, "cutoff": cutoff.isoformat(), "error": str(e)}
+
 # Fonctions de compatibilité
 def init_db():
     """Alias pour compatibilité"""
@@ -419,8 +498,8 @@ def verify_schema():
 
 # Export des éléments principaux
 __all__ = [
-    'Base', 'engine', 'SessionLocal', 'get_db', 'get_db_session',
+    'Base', 'engine', 'SessionLocal', 'TaskSession', 'get_db', 'get_db_session',
     'test_database_connection', 'init_database', 'init_db', 'create_tables',
     'ScrapingTask', 'upgrade_schema_smart', 'normalize_data_smart', 
-    'get_database_status', 'SmartDatabaseConfig'
+    'get_database_status', 'cleanup_old_tasks', 'SmartDatabaseConfig'
 ]
\ No newline at end of file
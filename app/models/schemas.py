@@ -90,6 +90,10 @@ class ScrapingRequest(BaseModel):
     priority: int = Field(1, ge=1, le=10, description="Priorité de la tâche")
     quality_threshold: float = Field(0.6, ge=0.0, le=1.0, description="Seuil de qualité")
     callback_url: Optional[str] = Field(None, description="URL de callback")
+    concurrency: Optional[int] = Field(
+        None, ge=1, le=32,
+        description="URLs scrapées simultanément (plafonné par SCRAPE_URL_CONCURRENCY du worker)"
+    )
     
     @field_validator('urls')
     @classmethod
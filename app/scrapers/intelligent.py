@@ -500,7 +500,8 @@ class CohesiveIntelligentScraper(TunisianWebScraper):
         logger.info(f"Attempting AJAX simulation strategy for {url}")
         
         try:
-            session = requests.Session()
+            # Pas d'état de session requis : pool keep-alive partagé du processus
+            session = self.session
             response = session.get(url, timeout=config.get('timeout', 60))
             
             if response.status_code != 200:
@@ -641,7 +642,8 @@ class CohesiveIntelligentScraper(TunisianWebScraper):
     def _strategy_enhanced_requests(self, url: str, config: Dict) -> Optional[ScrapedContent]:
         """Stratégie 1: Requêtes HTTP améliorées avec headers tunisiens"""
         
-        session = requests.Session()
+        # Headers passés par requête : la session partagée (keep-alive) n'est pas mutée
+        session = self.session
         
         # Headers spécialisés pour sites tunisiens
         headers = {
@@ -9,10 +9,13 @@ import json
 import requests
 import time
 import io
-from typing import Optional, Dict, List, Any, Tuple
+import threading
+from itertools import islice
+from typing import Optional, Dict, List, Any, Tuple, Iterator
 import logging
+from functools import lru_cache
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from datetime import datetime
@@ -29,7 +32,7 @@ from app.config.settings import settings
 
 # INTÉGRATION CRITIQUE : Import de TOUS les utils
 from app.utils.helpers import (
-    format_timestamp, calculate_execution_time, extract_domain,
+    format_timestamp, extract_domain,
     validate_url, categorize_url_type, detect_tunisian_content_patterns,
     suggest_optimal_strategy, debug_extraction_data, log_extraction_details,
     suggest_extraction_improvements
@@ -39,9 +42,14 @@ from app.utils.temporal_filter import filter_by_temporal_period, is_in_target_pe
 from app.utils.clean_extraction_patterns import extract_clean_economic_data, is_valid_indicator
 from app.utils.storage import smart_storage
 
-# Imports PDF/Excel sécurisés
+# Imports PDF/Excel/selectolax/orjson sécurisés
 PDF_AVAILABLE = False
 EXCEL_AVAILABLE = False
+SELECTOLAX_AVAILABLE = False
+ORJSON_AVAILABLE = False
+LXML_AVAILABLE = False
+HYPERSCAN_AVAILABLE = False
+CHARSET_NORMALIZER_AVAILABLE = False
 
 try:
     from pypdf import PdfReader
@@ -63,11 +71,359 @@ except ImportError:
     except ImportError:
         pass
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    pass
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    pass
+
+try:
+    import lxml  # noqa: F401  (parseur BeautifulSoup)
+    LXML_AVAILABLE = True
+except ImportError:
+    pass
+
+try:
+    import charset_normalizer
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    pass
+
+# Parseur BeautifulSoup : lxml (C) si disponible, html.parser sinon
+_BS4_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Seuls les tableaux et conteneurs structurés sont parcourus via BeautifulSoup
+_STRUCTURE_STRAINER = SoupStrainer(['table', 'ul', 'ol', 'dl', 'div'])
+
+# Blocs <script>/<style> retirés avant l'extraction de texte en fallback
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+# Décodage JSON : orjson (C/SIMD) si disponible, json standard sinon
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 logger = logging.getLogger(__name__)
 
+# Années 2010-2029 (chiffres ASCII : aucune normalisation de casse nécessaire)
+_YEAR_RE = re.compile(r'\b(20[1-2][0-9])\b')
+
+def _decode_body(raw: bytes, encoding: Optional[str]) -> str:
+    """Décodage du corps déjà tronqué : octets invalides remplacés (U+FFFD), jamais supprimés.
+    
+    Sans charset annoncé, l'encodage est détecté sur la tranche lue seulement.
+    """
+    if not encoding and CHARSET_NORMALIZER_AVAILABLE and raw:
+        best = charset_normalizer.from_bytes(raw).best()
+        encoding = best.encoding if best else None
+    try:
+        return raw.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return raw.decode('utf-8', errors='replace')
+
+# Session HTTP partagée par processus : le pool keep-alive survit aux instances du scraper
+_shared_session: Optional[requests.Session] = None
+_shared_session_pid: Optional[int] = None
+_shared_session_lock = threading.Lock()
+
+def close_shared_session():
+    """Ferme le pool keep-alive du processus (arrêt du worker)"""
+    global _shared_session, _shared_session_pid
+    
+    with _shared_session_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            logger.info("Shared HTTP session closed")
+        _shared_session = None
+        _shared_session_pid = None
+
+# Sources fiables
+_TRUSTED_TUNISIAN_DOMAINS = ('bct.gov.tn', 'ins.tn', 'finances.gov.tn')
+_TRUSTED_INTERNATIONAL_DOMAINS = ('api.worldbank.org', 'data.worldbank.org', 'imf.org')
+_GOVERNMENT_DOMAIN_MARKERS = ('.gov.', '.gouv.')
+
+# Headers spéciaux pour sites tunisiens (passés par requête, la session partagée n'est pas mutée)
+_TUNISIAN_REQUEST_HEADERS = {
+    'Accept-Language': 'fr-FR,fr;q=0.9,ar-TN;q=0.8',
+    'Referer': 'https://www.google.com/',
+}
+
+@lru_cache(maxsize=256)
+def _source_domain(url: str) -> str:
+    """Domaine source mis en cache : constant pour toutes les valeurs d'une même page"""
+    return extract_domain(url)
+
+# Patterns modernes optimisés (compilés une seule fois par processus)
+_MODERN_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in (
+        # World Bank API spécialisés
+        r'"value":\s*([0-9]+\.?[0-9]*(?:e[+-]?\d+)?)',
+        r'"date":\s*"(\d{4})".*?"value":\s*([0-9]+\.?[0-9]*)',
+        
+        # Sites tunisiens (BCT, INS, etc.)
+        r'([A-Za-zÀ-ÿ\s\-_\.]{5,50})\s*[:=\-]\s*([0-9]+[,.]?[0-9]*)\s*(MD|MDT|%|millions?|milliards?|TND|USD|EUR)?',
+        
+        # APIs internationales
+        r'"([a-zA-Z_][a-zA-Z0-9_]*)":\s*([0-9]+\.?[0-9]*(?:e[+-]?\d+)?)',
+        
+        # Tables HTML responsive
+        r'<t[dh][^>]*>([^<]{3,60})</t[dh]>\s*<t[dh][^>]*>([0-9,]+\.?[0-9]*[%]?)</t[dh]>',
+    )
+]
+
+def _build_combined_pattern(patterns: List[re.Pattern]) -> Tuple[re.Pattern, Dict[str, Tuple[int, Tuple[int, ...]]]]:
+    """Fusionne les patterns (nom, valeur[, unité]) en une alternance à groupes nommés.
+    
+    Retourne le pattern combiné et la table groupe nommé -> (index du pattern, groupes internes).
+    Les patterns à un seul groupe ne produisent aucune valeur et sont écartés.
+    """
+    usable = [(idx, pattern) for idx, pattern in enumerate(patterns) if pattern.groups >= 2]
+    combined = re.compile(
+        '|'.join(f'(?P<p{idx}>{pattern.pattern})' for idx, pattern in usable),
+        re.IGNORECASE | re.MULTILINE
+    )
+    
+    group_table = {}
+    for idx, pattern in usable:
+        first_group = combined.groupindex[f'p{idx}'] + 1
+        group_table[f'p{idx}'] = (idx, tuple(range(first_group, first_group + pattern.groups)))
+    
+    return combined, group_table
+
+# Balayage unique du contenu pour tous les patterns modernes
+_MODERN_COMBINED_RE, _MODERN_GROUP_TABLE = _build_combined_pattern(_MODERN_PATTERNS)
+
+def _build_hyperscan_database(patterns: List[re.Pattern]):
+    """Base Hyperscan (DFA multi-patterns) des patterns modernes exploitables, None si indisponible"""
+    if not HYPERSCAN_AVAILABLE:
+        return None
+    
+    usable = [(idx, pattern) for idx, pattern in enumerate(patterns) if pattern.groups >= 2]
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE |
+             hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.pattern.encode('utf-8') for _, pattern in usable],
+            ids=[idx for idx, _ in usable],
+            elements=len(usable),
+            flags=[flags] * len(usable)
+        )
+        return database
+    except Exception as e:
+        logger.warning(f"Hyperscan compilation failed, using re fallback: {e}")
+        return None
+
+_MODERN_HS_DATABASE = _build_hyperscan_database(_MODERN_PATTERNS)
+
+def _iter_modern_matches(content: str) -> Iterator[Tuple[int, Tuple[Optional[str], ...], str]]:
+    """(index du pattern, groupes, texte brut) pour chaque correspondance, dans l'ordre du texte.
+    
+    Hyperscan localise les correspondances en un balayage ; le pattern Python n'est
+    ré-exécuté que sur la tranche trouvée pour récupérer les groupes.
+    """
+    if _MODERN_HS_DATABASE is None:
+        for match in _MODERN_COMBINED_RE.finditer(content):
+            pattern_idx, group_indices = _MODERN_GROUP_TABLE[match.lastgroup]
+            yield pattern_idx, match.group(*group_indices), match.group(0)
+        return
+    
+    data = content.encode('utf-8')
+    
+    # Hyperscan signale chaque fin possible : garder la fin maximale par (pattern, début)
+    spans: Dict[Tuple[int, int], int] = {}
+    
+    def on_match(pattern_id, start, end, flags, context):
+        key = (start, pattern_id)
+        if end > spans.get(key, -1):
+            spans[key] = end
+    
+    _MODERN_HS_DATABASE.scan(data, match_event_handler=on_match)
+    
+    # Correspondances non chevauchantes par pattern, comme re.finditer
+    next_free = [0] * len(_MODERN_PATTERNS)
+    for (start, pattern_idx), end in sorted(spans.items()):
+        if start < next_free[pattern_idx]:
+            continue
+        
+        match = _MODERN_PATTERNS[pattern_idx].match(data[start:end].decode('utf-8', errors='ignore'))
+        if match is None or not match.group(0):
+            continue
+        
+        next_free[pattern_idx] = start + len(match.group(0).encode('utf-8'))
+        yield pattern_idx, match.groups(), match.group(0)
+
+# Indicateurs économiques tunisiens (ordre = priorité de catégorisation)
+_TUNISIAN_INDICATORS = {
+    'monetary': ['taux directeur', 'taux d\'intérêt', 'tmm', 'inflation', 'déflation'],
+    'statistical': ['population', 'démographie', 'emploi', 'chômage', 'unemployment'],
+    'trade': ['exportations', 'importations', 'balance commerciale', 'exports', 'imports'],
+    'fiscal': ['pib', 'gdp', 'dette publique', 'déficit budgétaire', 'budget deficit'],
+    'financial': ['réserves', 'change', 'bourse', 'indice', 'reserves', 'exchange rate']
+}
+
+_CATEGORY_MAPPING = {
+    'monetary': 'MONETARY',
+    'statistical': 'DEMOGRAPHIC',
+    'trade': 'TRADE',
+    'fiscal': 'FISCAL',
+    'financial': 'FINANCIAL'
+}
+
+# Alternance unique : un groupe nommé par catégorie, appliquée sur le nom en minuscules
+_CATEGORY_RE = re.compile('|'.join(
+    f"(?P<{category}>{'|'.join(re.escape(keyword) for keyword in keywords)})"
+    for category, keywords in _TUNISIAN_INDICATORS.items()
+))
+_CATEGORY_PRIORITY = {category: rank for rank, category in enumerate(_TUNISIAN_INDICATORS)}
+
+def _keyword_probe(keywords) -> re.Pattern:
+    """Alternance compilée de sous-chaînes littérales (équivaut à any(k in texte) sur texte en minuscules)"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# Mots-clés INS et mots-clés économiques généraux
+_INS_KEYWORDS = (
+    'épargne', 'formation', 'capital', 'investissement',
+    'population', 'emploi', 'chômage', 'entreprises'
+)
+_ECONOMIC_KEYWORDS = (
+    'pib', 'gdp', 'inflation', 'taux', 'dette', 'budget',
+    'population', 'emploi', 'chômage', 'export', 'import',
+    'réserves', 'change', 'crédit', 'épargne', 'formation'
+)
+_INS_KEYWORD_RE = _keyword_probe(_INS_KEYWORDS)
+_ECONOMIC_KEYWORD_RE = _keyword_probe(_ECONOMIC_KEYWORDS)
+
+# Sondes de validation et de détermination d'unité (noms en minuscules)
+_YEAR_WORD_RE = _keyword_probe(('year', 'année', 'date', 'période'))
+_RATE_WORD_RE = _keyword_probe(('taux', 'rate', '%', 'croissance'))
+_GDP_WORD_RE = _keyword_probe(('pib', 'gdp', 'dette'))
+_BCT_RATE_WORD_RE = _keyword_probe(('taux', 'rate'))
+_INS_STOCK_WORD_RE = _keyword_probe(('épargne', 'formation', 'capital'))
+_INS_RATE_WORD_RE = _keyword_probe(('taux', 'croissance'))
+_CONTEXT_RATE_WORD_RE = _keyword_probe(('taux', '%', 'croissance'))
+_CONTEXT_AMOUNT_WORD_RE = _keyword_probe(('pib', 'budget', 'dette'))
+
+# Descriptions d'unités
+_UNIT_DESCRIPTIONS = {
+    'MD': 'Millions de Dinars',
+    'MDT': 'Millions de Dinars Tunisiens',
+    '%': 'Pourcentage',
+    'USD': 'Dollars Américains',
+    'EUR': 'Euros',
+    'TND': 'Dinars Tunisiens',
+    'habitants': 'Nombre d\'habitants'
+}
+
+# Mots-clés des indicateurs cibles
+_TARGET_KEYWORDS = (
+    'pib', 'gdp', 'inflation', 'taux directeur', 'chômage',
+    'population', 'dette', 'export', 'import', 'balance'
+)
+_TARGET_KEYWORD_RE = _keyword_probe(_TARGET_KEYWORDS)
+
+# Fonctions pures de chaînes courtes, mises en cache au niveau module
+# (lru_cache sur une méthode retiendrait self) : les mêmes libellés reviennent sur une page.
+@lru_cache(maxsize=1024)
+def _categorize_indicator_name(name: str) -> str:
+    """Catégorie économique d'un nom d'indicateur"""
+    # Un seul balayage ; la catégorie la plus prioritaire parmi les mots-clés trouvés l'emporte
+    categories = {match.lastgroup for match in _CATEGORY_RE.finditer(name.lower())}
+    if not categories:
+        return 'OTHER'
+    
+    category = min(categories, key=_CATEGORY_PRIORITY.__getitem__)
+    return _CATEGORY_MAPPING.get(category, 'OTHER')
+
+@lru_cache(maxsize=1024)
+def _is_target_indicator_name(name: str) -> bool:
+    """Détection des indicateurs cibles d'après le nom"""
+    return _TARGET_KEYWORD_RE.search(name.lower()) is not None
+
+# Patterns spécifiques BCT
+_BCT_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(taux directeur|refinancement|intérêt)[:\s]*([0-9,\.]+)\s*%?',
+        r'(réserves?|masse monétaire|liquidité)[:\s]*([0-9\s,\.]+)\s*(md|millions?)?',
+        r'(change|euro|dollar)[:\s]*([0-9,\.]+)',
+    )
+]
+
+# Patterns budgétaires
+_FINANCE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(budget|recettes|dépenses|déficit)[:\s]*([0-9\s,\.]+)\s*(md|millions?|milliards?)?',
+        r'(dette|pib)[:\s]*([0-9\s,\.]+)\s*(md|millions?)?',
+        r'(investissement|transfert)[:\s]*([0-9\s,\.]+)',
+    )
+]
+
+# Patterns pour éléments structurés
+_STRUCTURED_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'([A-Za-zÀ-ÿ\s]{5,40})[:=]\s*([0-9,\.]+)\s*(MD|%|millions?)?',
+        r'([A-Za-zÀ-ÿ\s]{5,40})\s*:\s*([0-9,\.]+)',
+        r'([A-Za-zÀ-ÿ\s]{5,40})\s*-\s*([0-9,\.]+)',
+    )
+]
+
+# Classes CSS des éléments structurés
+_STRUCTURED_CLASS_RE = re.compile(r'(data|stat|info|metric)', re.I)
+
+# Éléments non économiques (appliqués sur le texte en minuscules)
+_EXCLUSION_PATTERNS = [
+    re.compile(pattern) for pattern in (
+        r'^(table|tableau|total|somme)',
+        r'^(année|year|date)',
+        r'^[0-9]{4}',  # Années seules
+    )
+]
+
+# Unités reconnues (appliquées sur le texte en minuscules)
+_UNIT_PATTERNS = [
+    (re.compile(r'%|pourcent'), '%'),
+    (re.compile(r'md|millions?\s*de?\s*dinars?'), 'MD'),
+    (re.compile(r'milliards?'), 'MD'),
+    (re.compile(r'usd|dollars?'), 'USD'),
+    (re.compile(r'eur|euros?'), 'EUR'),
+    (re.compile(r'habitants?'), 'habitants'),
+]
+
+# Premier caractère significatif (sonde JSON sans copie du contenu)
+_FIRST_NON_WS_RE = re.compile(r'\S')
+
+class _NumericCharTable(dict):
+    """Table str.translate : conserve chiffres, blancs, ',', '.', '-' et supprime le reste.
+    
+    Équivalent de re.sub(r'[^\\d\\s,\\.\\-]', '', text) ; chaque code point est classé
+    une seule fois puis mis en cache dans le dictionnaire.
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        kept = codepoint if (char.isdecimal() or char.isspace() or char in ',.-') else None
+        self[codepoint] = kept
+        return kept
+
+# Nettoyage numérique
+_NUMERIC_CHAR_TABLE = _NumericCharTable()
+
 class CohesiveTunisianWebScraper:
     """Scraper Traditionnel utilisant TOUS les modules du projet de manière cohérente"""
     
+    # Nombre maximal de valeurs extraites par page (toutes méthodes confondues)
+    MAX_EXTRACTED_VALUES = 500
+    
     def __init__(self, delay: float = None):
         self.delay = delay or settings.DEFAULT_DELAY
         self.timeout = settings.REQUEST_TIMEOUT
@@ -75,8 +431,8 @@ class CohesiveTunisianWebScraper:
         self.user_agent = settings.SCRAPE_USER_AGENT
         self.max_content_size = settings.MAX_CONTENT_LENGTH
         
-        # Session HTTP moderne
-        self.session = self._create_modern_session()
+        # Session HTTP moderne (partagée au sein du processus)
+        self.session = self._get_shared_session()
         
         # Patterns d'extraction optimisés
         self._setup_extraction_patterns()
@@ -92,6 +448,17 @@ class CohesiveTunisianWebScraper:
         
         logger.info("CohesiveTunisianWebScraper initialized with ALL modules")
 
+    def _get_shared_session(self) -> requests.Session:
+        """Session partagée, recréée après un fork pour ne pas partager les sockets entre processus"""
+        global _shared_session, _shared_session_pid
+        
+        with _shared_session_lock:
+            if _shared_session is None or _shared_session_pid != os.getpid():
+                _shared_session = self._create_modern_session()
+                _shared_session_pid = os.getpid()
+                logger.info("Shared HTTP session created for traditional scraper")
+            return _shared_session
+
     def _create_modern_session(self) -> requests.Session:
         """Session HTTP moderne utilisant les helpers pour la configuration"""
         session = requests.Session()
@@ -107,8 +474,8 @@ class CohesiveTunisianWebScraper:
         
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_maxsize=20,
-            pool_connections=10,
+            pool_maxsize=32,
+            pool_connections=16,
             pool_block=False
         )
         
@@ -131,35 +498,16 @@ class CohesiveTunisianWebScraper:
     def _setup_extraction_patterns(self) -> None:
         """Configuration des patterns utilisant les helpers"""
         
-        # Patterns modernes optimisés
-        self.modern_patterns = [
-            # World Bank API spécialisés
-            r'"value":\s*([0-9]+\.?[0-9]*(?:e[+-]?\d+)?)',
-            r'"date":\s*"(\d{4})".*?"value":\s*([0-9]+\.?[0-9]*)',
-            
-            # Sites tunisiens (BCT, INS, etc.)
-            r'([A-Za-zÀ-ÿ\s\-_\.]{5,50})\s*[:=\-]\s*([0-9]+[,.]?[0-9]*)\s*(MD|MDT|%|millions?|milliards?|TND|USD|EUR)?',
-            
-            # APIs internationales
-            r'"([a-zA-Z_][a-zA-Z0-9_]*)":\s*([0-9]+\.?[0-9]*(?:e[+-]?\d+)?)',
-            
-            # Tables HTML responsive
-            r'<t[dh][^>]*>([^<]{3,60})</t[dh]>\s*<t[dh][^>]*>([0-9,]+\.?[0-9]*[%]?)</t[dh]>',
-        ]
+        # Patterns modernes précompilés
+        self.modern_patterns = _MODERN_PATTERNS
         
         # Indicateurs économiques tunisiens
-        self.tunisian_indicators = {
-            'monetary': ['taux directeur', 'taux d\'intérêt', 'tmm', 'inflation', 'déflation'],
-            'statistical': ['population', 'démographie', 'emploi', 'chômage', 'unemployment'],
-            'trade': ['exportations', 'importations', 'balance commerciale', 'exports', 'imports'],
-            'fiscal': ['pib', 'gdp', 'dette publique', 'déficit budgétaire', 'budget deficit'],
-            'financial': ['réserves', 'change', 'bourse', 'indice', 'reserves', 'exchange rate']
-        }
+        self.tunisian_indicators = _TUNISIAN_INDICATORS
 
     def scrape(self, url: str, enable_llm_analysis: bool = False) -> Optional[ScrapedContent]:
         """Point d'entrée principal avec intégration complète des utils"""
         
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"Starting cohesive traditional scraping: {url}")
@@ -184,6 +532,20 @@ class CohesiveTunisianWebScraper:
                 logger.warning(f"No content retrieved: {url}")
                 return None
             
+            return self._process_fetched_content(
+                url, content, headers, start_time, enable_llm_analysis, strategy_suggestion
+            )
+            
+        except Exception as e:
+            logger.error(f"Cohesive traditional scraping failed for {url}: {e}", exc_info=True)
+            return None
+
+    def _process_fetched_content(self, url: str, content: str, headers: Dict[str, str],
+                                 start_time: float, enable_llm_analysis: bool,
+                                 strategy_suggestion: Dict[str, Any]) -> Optional[ScrapedContent]:
+        """Analyse, extraction et post-traitement d'un contenu déjà récupéré"""
+        
+        try:
             # Analyse de source moderne avec helpers
             source_analysis = self._analyze_source_with_helpers(url, headers)
             
@@ -194,7 +556,8 @@ class CohesiveTunisianWebScraper:
             post_processed_data = self._apply_comprehensive_post_processing(extracted_data, content, url)
             
             # Construction du résultat final
-            execution_time = calculate_execution_time(start_time, datetime.utcnow())
+            # Durée monotone (perf_counter), insensible aux ajustements d'horloge
+            execution_time = round(time.perf_counter() - start_time, 3)
             result = self._build_cohesive_scraped_content(
                 content, post_processed_data, source_analysis, url, execution_time, enable_llm_analysis
             )
@@ -209,7 +572,7 @@ class CohesiveTunisianWebScraper:
             return result
             
         except Exception as e:
-            logger.error(f"Cohesive traditional scraping failed for {url}: {e}")
+            logger.error(f"Cohesive traditional processing failed for {url}: {e}")
             return None
 
     def _analyze_source_with_helpers(self, url: str, headers: Dict[str, str]) -> SourceAnalysis:
@@ -220,21 +583,18 @@ class CohesiveTunisianWebScraper:
             
             # Utiliser extract_domain des helpers
             domain = extract_domain(url)
+            domain_lower = domain.lower()
             
             # Utiliser categorize_url_type des helpers
             url_type = categorize_url_type(url)
             
             # Classification moderne des sources
-            is_government = any(gov_indicator in domain.lower() for gov_indicator in ['.gov.', '.gouv.'])
+            is_government = any(gov_indicator in domain_lower for gov_indicator in _GOVERNMENT_DOMAIN_MARKERS)
             
             # Sources fiables
-            trusted_tunisian = ['bct.gov.tn', 'ins.tn', 'finances.gov.tn']
-            trusted_international = ['api.worldbank.org', 'data.worldbank.org', 'imf.org']
-            
-            is_trusted_source = (
-                any(trusted_domain in domain.lower() for trusted_domain in trusted_tunisian) or
-                any(trusted_domain in domain.lower() for trusted_domain in trusted_international)
-            )
+            is_tunisian_source = any(trusted_domain in domain_lower for trusted_domain in _TRUSTED_TUNISIAN_DOMAINS)
+            is_international_source = any(trusted_domain in domain_lower for trusted_domain in _TRUSTED_INTERNATIONAL_DOMAINS)
+            is_trusted_source = is_tunisian_source or is_international_source
             
             # Type de contenu avec extensions
             content_type = headers.get('content-type', '').lower()
@@ -248,9 +608,9 @@ class CohesiveTunisianWebScraper:
                 data_type = 'web_page'
             
             # Langue basée sur la source
-            if any(tn_domain in domain.lower() for tn_domain in trusted_tunisian):
+            if is_tunisian_source:
                 language = 'french_arabic'
-            elif any(intl_domain in domain.lower() for intl_domain in trusted_international):
+            elif is_international_source:
                 language = 'english'
             else:
                 language = 'mixed'
@@ -277,7 +637,12 @@ class CohesiveTunisianWebScraper:
             logger.info(f"Starting comprehensive extraction for {url}")
             
             # 1. EXTRACTION DE BASE selon le type
-            if source_analysis.content_type == 'api_data':
+            is_json_payload = (
+                source_analysis.content_type == 'api_data'
+                or 'api.worldbank.org' in url
+                or self._looks_like_json(content)
+            )
+            if is_json_payload:
                 base_values = self._extract_json_comprehensive(content, url)
             elif source_analysis.content_type == 'pdf_document' and PDF_AVAILABLE:
                 base_values = self._extract_pdf_content(content, url)
@@ -286,24 +651,31 @@ class CohesiveTunisianWebScraper:
             else:
                 base_values = self._extract_html_comprehensive(content, url)
             
-            extracted_values.update(base_values)
+            extracted_values.update(islice(base_values.items(), self.MAX_EXTRACTED_VALUES))
             logger.info(f"Base extraction: {len(base_values)} values")
             
             # 2. INTÉGRATION : Extraction supplémentaire avec clean_extraction_patterns
-            self.module_usage['clean_extractor'] += 1
-            clean_values = extract_clean_economic_data(content, url)
+            # (HTML uniquement : un payload JSON ne passe pas par BeautifulSoup)
+            if is_json_payload:
+                clean_values = {}
+            else:
+                self.module_usage['clean_extractor'] += 1
+                clean_values = extract_clean_economic_data(content, url)
             
             # Fusionner sans doublons
             for key, value in clean_values.items():
+                if len(extracted_values) >= self.MAX_EXTRACTED_VALUES:
+                    break
                 clean_key = f"clean_{key}"
                 if clean_key not in extracted_values:
                     extracted_values[clean_key] = value
             
             logger.info(f"Clean extraction added: {len(clean_values)} additional values")
             
-            # 3. Extraction par patterns modernes
-            pattern_values = self._extract_patterns_comprehensive(content, url)
-            extracted_values.update(pattern_values)
+            # 3. Extraction par patterns modernes (flux interrompu une fois le plafond atteint)
+            remaining = self.MAX_EXTRACTED_VALUES - len(extracted_values)
+            if remaining > 0:
+                extracted_values.update(islice(self._iter_pattern_values(content, url), remaining))
             
             logger.info(f"Total extraction: {len(extracted_values)} values from all methods")
             
@@ -320,18 +692,19 @@ class CohesiveTunisianWebScraper:
         # Timeout adaptatif selon la source
         timeout = self._calculate_adaptive_timeout(url)
         
+        # Headers spéciaux pour sites tunisiens (identiques pour toutes les tentatives)
+        request_headers = None
+        if any(tn_domain in url.lower() for tn_domain in _TRUSTED_TUNISIAN_DOMAINS):
+            request_headers = _TUNISIAN_REQUEST_HEADERS
+        
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
         for attempt in range(self.max_retries + 1):
             try:
-                logger.debug(f"Fetch attempt {attempt + 1}: {url}")
+                if debug_enabled:
+                    logger.debug(f"Fetch attempt {attempt + 1}: {url}")
                 
-                # Headers spéciaux pour sites tunisiens
-                if any(tn_domain in url.lower() for tn_domain in ['bct.gov.tn', 'ins.tn', 'finances.gov.tn']):
-                    self.session.headers.update({
-                        'Accept-Language': 'fr-FR,fr;q=0.9,ar-TN;q=0.8',
-                        'Referer': 'https://www.google.com/',
-                    })
-                
-                response = self.session.get(url, timeout=timeout, stream=True)
+                response = self.session.get(url, timeout=timeout, stream=True, headers=request_headers)
                 response.raise_for_status()
                 
                 headers = dict(response.headers)
@@ -343,31 +716,61 @@ class CohesiveTunisianWebScraper:
                 elif any(excel_type in content_type for excel_type in ['excel', 'spreadsheet', 'sheet']) and EXCEL_AVAILABLE:
                     content = self._extract_excel_content_safe(response.content)
                 else:
-                    content = response.text
+                    content = self._read_text_capped(response)
                 
                 if content and len(content.strip()) > 10:
                     if len(content) > self.max_content_size:
                         content = content[:self.max_content_size]
                     
                     time.sleep(self.delay)
-                    logger.info(f"Content fetched: {len(content)} chars, type: {content_type}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Content fetched: {len(content)} chars, type: {content_type}")
                     return content, headers
                 
+            except requests.Timeout:
+                logger.warning(f"Fetch attempt {attempt + 1} timed out after {timeout}s: {url}")
+            except requests.HTTPError as e:
+                status_code = e.response.status_code if e.response is not None else None
+                logger.warning(f"Fetch attempt {attempt + 1} failed: HTTP {status_code} for {url}")
+                # Erreur client définitive : inutile de réessayer (sauf 408/429)
+                if status_code is not None and 400 <= status_code < 500 and status_code not in (408, 429):
+                    return None, headers
+            except requests.ConnectionError as e:
+                logger.warning(f"Fetch attempt {attempt + 1} connection error for {url}: {e}")
             except Exception as e:
-                logger.warning(f"Fetch attempt {attempt + 1} failed: {e}")
-                if attempt < self.max_retries:
-                    time.sleep(2 ** attempt)
-                    continue
+                logger.error(f"Fetch attempt {attempt + 1} failed unexpectedly for {url}: {e}", exc_info=True)
+            
+            if attempt < self.max_retries:
+                time.sleep(2 ** attempt)
         
         return None, headers
 
+    def _read_text_capped(self, response: requests.Response) -> str:
+        """Lecture du corps limitée à max_content_size octets, décodée une seule fois"""
+        budget = self.max_content_size
+        
+        # Taille annoncée sous le budget : lecture directe
+        content_length = response.headers.get('content-length', '')
+        if content_length.isdigit() and int(content_length) <= budget:
+            raw = response.content
+        else:
+            buffer = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buffer += chunk
+                if len(buffer) >= budget:
+                    break
+            response.close()
+            raw = bytes(buffer[:budget])
+        
+        return _decode_body(raw, response.encoding)
+
     def _calculate_adaptive_timeout(self, url: str) -> int:
         """Calcul de timeout adaptatif selon le type de source"""
         url_lower = url.lower()
         
         if 'api.worldbank.org' in url_lower:
             return min(30, self.timeout)
-        elif any(tn_domain in url_lower for tn_domain in ['bct.gov.tn', 'ins.tn', 'finances.gov.tn']):
+        elif any(tn_domain in url_lower for tn_domain in _TRUSTED_TUNISIAN_DOMAINS):
             return min(90, self.timeout * 1.5)
         else:
             return self.timeout
@@ -430,12 +833,22 @@ class CohesiveTunisianWebScraper:
             logger.warning(f"Excel extraction failed: {e}")
             return ""
 
+    def _looks_like_json(self, content: str) -> bool:
+        """Sonde JSON sur le premier caractère non blanc, sans strip() du contenu complet"""
+        first_char = _FIRST_NON_WS_RE.search(content)
+        return first_char is not None and first_char.group() in '[{'
+
     def _extract_json_comprehensive(self, content: str, url: str) -> Dict[str, Any]:
         """Extraction JSON complète avec tous les patterns"""
         extracted_values = {}
+        extraction_timestamp = datetime.utcnow().isoformat()
+        
+        if not self._looks_like_json(content):
+            logger.info("JSON extraction skipped: content is not JSON")
+            return extracted_values
         
         try:
-            data = json.loads(content.strip())
+            data = _json_loads(content)
             
             # World Bank format spécialisé
             if 'worldbank.org' in url.lower() and isinstance(data, list) and len(data) >= 2:
@@ -450,8 +863,7 @@ class CohesiveTunisianWebScraper:
                             country = item.get('country', {}).get('value', 'Tunisia')
                             indicator = item.get('indicator', {}).get('value', 'GDP')
                             
-                            key = f"wb_{date}_{idx}"
-                            extracted_values[key] = self._create_enhanced_value_cohesive(
+                            value_data = self._create_enhanced_value_cohesive(
                                 value=float(value),
                                 name=f"{indicator} {country} {date}",
                                 unit="USD",
@@ -459,22 +871,28 @@ class CohesiveTunisianWebScraper:
                                 method="json_worldbank",
                                 url=url,
                                 confidence=0.95,
-                                year=int(date) if date.isdigit() else 2024
+                                year=int(date) if date.isdigit() else 2024,
+                                timestamp=extraction_timestamp
                             )
+                            if value_data is not None:
+                                extracted_values[f"wb_{date}_{idx}"] = value_data
             
             # Format JSON générique
             elif isinstance(data, dict):
                 for key, value in data.items():
                     if isinstance(value, (int, float)) and self._is_economic_value(value, key):
-                        extracted_values[f"json_{key}"] = self._create_enhanced_value_cohesive(
+                        value_data = self._create_enhanced_value_cohesive(
                             value=float(value),
                             name=key,
                             unit="",
                             raw_text=f"{key}: {value}",
                             method="json_generic",
                             url=url,
-                            confidence=0.8
+                            confidence=0.8,
+                            timestamp=extraction_timestamp
                         )
+                        if value_data is not None:
+                            extracted_values[f"json_{key}"] = value_data
             
             logger.info(f"JSON extraction: {len(extracted_values)} values")
             
@@ -488,15 +906,17 @@ class CohesiveTunisianWebScraper:
         extracted_values = {}
         
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-            
             # Extraction spécialisée selon la source
-            if 'bct.gov.tn' in url.lower():
-                extracted_values.update(self._extract_bct_specialized(soup, url))
-            elif 'ins.tn' in url.lower():
-                extracted_values.update(self._extract_ins_specialized(soup, url))
-            elif 'finances.gov.tn' in url.lower():
-                extracted_values.update(self._extract_finance_specialized(soup, url))
+            url_lower = url.lower()
+            if 'bct.gov.tn' in url_lower:
+                extracted_values.update(self._extract_bct_specialized(self._extract_page_text(content), url))
+            elif 'ins.tn' in url_lower:
+                extracted_values.update(self._extract_ins_specialized(self._extract_page_text(content), url))
+            elif 'finances.gov.tn' in url_lower:
+                extracted_values.update(self._extract_finance_specialized(self._extract_page_text(content), url))
+            
+            # Arbre partiel : tableaux et conteneurs structurés uniquement
+            soup = BeautifulSoup(content, _BS4_PARSER, parse_only=_STRUCTURE_STRAINER)
             
             # Extraction générique depuis les tables
             tables = soup.find_all('table')[:10]
@@ -506,7 +926,7 @@ class CohesiveTunisianWebScraper:
             
             # Extraction depuis les listes et divs
             structured_elements = soup.find_all(['ul', 'ol', 'dl', 'div'], 
-                                               class_=re.compile(r'(data|stat|info|metric)', re.I))
+                                               class_=_STRUCTURED_CLASS_RE)
             
             for elem_idx, element in enumerate(structured_elements[:5]):
                 element_values = self._extract_structured_element_values(element, url, elem_idx)
@@ -519,22 +939,27 @@ class CohesiveTunisianWebScraper:
         
         return extracted_values
 
-    def _extract_bct_specialized(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _extract_page_text(self, content: str) -> str:
+        """Texte brut de la page via selectolax (Lexbor), BeautifulSoup en fallback"""
+        if SELECTOLAX_AVAILABLE:
+            try:
+                tree = LexborHTMLParser(content)
+                node = tree.body or tree.root
+                if node is not None:
+                    return node.text()
+            except Exception as e:
+                logger.debug(f"selectolax text extraction failed, using BeautifulSoup: {e}")
+        
+        return BeautifulSoup(_SCRIPT_STYLE_RE.sub(' ', content), _BS4_PARSER).get_text()
+
+    def _extract_bct_specialized(self, full_text: str, url: str) -> Dict[str, Any]:
         """Extraction spécialisée BCT"""
         extracted_values = {}
+        extraction_timestamp = datetime.utcnow().isoformat()
         
         try:
-            # Patterns spécifiques BCT
-            bct_patterns = [
-                r'(taux directeur|refinancement|intérêt)[:\s]*([0-9,\.]+)\s*%?',
-                r'(réserves?|masse monétaire|liquidité)[:\s]*([0-9\s,\.]+)\s*(md|millions?)?',
-                r'(change|euro|dollar)[:\s]*([0-9,\.]+)',
-            ]
-            
-            full_text = soup.get_text()
-            
-            for pattern_idx, pattern in enumerate(bct_patterns):
-                matches = re.finditer(pattern, full_text, re.IGNORECASE)
+            for pattern_idx, pattern in enumerate(_BCT_PATTERNS):
+                matches = pattern.finditer(full_text)
                 
                 for match_idx, match in enumerate(matches):
                     if len(extracted_values) >= 15:  # Limite BCT
@@ -548,29 +973,31 @@ class CohesiveTunisianWebScraper:
                     if numeric_value is not None:
                         unit = self._determine_bct_unit(indicator_name, unit_hint, numeric_value)
                         
-                        key = f"bct_{pattern_idx}_{match_idx}"
-                        extracted_values[key] = self._create_enhanced_value_cohesive(
+                        value_data = self._create_enhanced_value_cohesive(
                             value=numeric_value,
                             name=f"BCT {indicator_name}",
                             unit=unit,
                             raw_text=match.group(0),
                             method="bct_specialized",
                             url=url,
-                            confidence=0.9
+                            confidence=0.9,
+                            timestamp=extraction_timestamp
                         )
+                        if value_data is not None:
+                            extracted_values[f"bct_{pattern_idx}_{match_idx}"] = value_data
             
         except Exception as e:
             logger.error(f"BCT specialized extraction failed: {e}")
         
         return extracted_values
 
-    def _extract_ins_specialized(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _extract_ins_specialized(self, full_text: str, url: str) -> Dict[str, Any]:
         """Extraction spécialisée INS"""
         extracted_values = {}
+        extraction_timestamp = datetime.utcnow().isoformat()
         
         try:
             # Format INS avec séparateurs
-            full_text = soup.get_text()
             lines = full_text.split('\n')
             
             for line_idx, line in enumerate(lines):
@@ -587,38 +1014,32 @@ class CohesiveTunisianWebScraper:
                                 if numeric_value is not None:
                                     unit = self._determine_ins_unit(indicator_name, numeric_value)
                                     
-                                    key = f"ins_{line_idx}_{val_idx}"
-                                    extracted_values[key] = self._create_enhanced_value_cohesive(
+                                    value_data = self._create_enhanced_value_cohesive(
                                         value=numeric_value,
                                         name=f"INS {indicator_name}",
                                         unit=unit,
                                         raw_text=line,
                                         method="ins_specialized",
                                         url=url,
-                                        confidence=0.85
+                                        confidence=0.85,
+                                        timestamp=extraction_timestamp
                                     )
+                                    if value_data is not None:
+                                        extracted_values[f"ins_{line_idx}_{val_idx}"] = value_data
         
         except Exception as e:
             logger.error(f"INS specialized extraction failed: {e}")
         
         return extracted_values
 
-    def _extract_finance_specialized(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _extract_finance_specialized(self, full_text: str, url: str) -> Dict[str, Any]:
         """Extraction spécialisée Finances"""
         extracted_values = {}
+        extraction_timestamp = datetime.utcnow().isoformat()
         
         try:
-            # Patterns budgétaires
-            finance_patterns = [
-                r'(budget|recettes|dépenses|déficit)[:\s]*([0-9\s,\.]+)\s*(md|millions?|milliards?)?',
-                r'(dette|pib)[:\s]*([0-9\s,\.]+)\s*(md|millions?)?',
-                r'(investissement|transfert)[:\s]*([0-9\s,\.]+)',
-            ]
-            
-            full_text = soup.get_text()
-            
-            for pattern_idx, pattern in enumerate(finance_patterns):
-                matches = re.finditer(pattern, full_text, re.IGNORECASE)
+            for pattern_idx, pattern in enumerate(_FINANCE_PATTERNS):
+                matches = pattern.finditer(full_text)
                 
                 for match_idx, match in enumerate(matches):
                     if len(extracted_values) >= 20:
@@ -632,16 +1053,18 @@ class CohesiveTunisianWebScraper:
                     if numeric_value is not None:
                         unit = unit_hint or ('MD' if numeric_value > 1000 else 'MDT')
                         
-                        key = f"finance_{pattern_idx}_{match_idx}"
-                        extracted_values[key] = self._create_enhanced_value_cohesive(
+                        value_data = self._create_enhanced_value_cohesive(
                             value=numeric_value,
                             name=f"Finance {indicator_name}",
                             unit=unit,
                             raw_text=match.group(0),
                             method="finance_specialized",
                             url=url,
-                            confidence=0.88
+                            confidence=0.88,
+                            timestamp=extraction_timestamp
                         )
+                        if value_data is not None:
+                            extracted_values[f"finance_{pattern_idx}_{match_idx}"] = value_data
         
         except Exception as e:
             logger.error(f"Finance specialized extraction failed: {e}")
@@ -651,6 +1074,7 @@ class CohesiveTunisianWebScraper:
     def _extract_table_values(self, table, url: str, table_idx: int) -> Dict[str, Any]:
         """Extraction depuis les tables HTML"""
         extracted_values = {}
+        extraction_timestamp = datetime.utcnow().isoformat()
         
         try:
             rows = table.find_all('tr')
@@ -672,16 +1096,18 @@ class CohesiveTunisianWebScraper:
                             if numeric_value is not None:
                                 unit = self._extract_unit_from_text(value_text, label_text)
                                 
-                                key = f"table_{table_idx}_{row_idx}_{cell_idx}"
-                                extracted_values[key] = self._create_enhanced_value_cohesive(
+                                value_data = self._create_enhanced_value_cohesive(
                                     value=numeric_value,
                                     name=label_text[:50],
                                     unit=unit,
                                     raw_text=f"{label_text}: {value_text}",
                                     method="html_table",
                                     url=url,
-                                    confidence=0.8
+                                    confidence=0.8,
+                                    timestamp=extraction_timestamp
                                 )
+                                if value_data is not None:
+                                    extracted_values[f"table_{table_idx}_{row_idx}_{cell_idx}"] = value_data
         
         except Exception as e:
             logger.error(f"Table extraction error: {e}")
@@ -691,19 +1117,13 @@ class CohesiveTunisianWebScraper:
     def _extract_structured_element_values(self, element, url: str, elem_idx: int) -> Dict[str, Any]:
         """Extraction depuis les éléments structurés"""
         extracted_values = {}
+        extraction_timestamp = datetime.utcnow().isoformat()
         
         try:
             text_content = element.get_text(separator=' ', strip=True)
             
-            # Patterns pour éléments structurés
-            structured_patterns = [
-                r'([A-Za-zÀ-ÿ\s]{5,40})[:=]\s*([0-9,\.]+)\s*(MD|%|millions?)?',
-                r'([A-Za-zÀ-ÿ\s]{5,40})\s*:\s*([0-9,\.]+)',
-                r'([A-Za-zÀ-ÿ\s]{5,40})\s*-\s*([0-9,\.]+)',
-            ]
-            
-            for pattern_idx, pattern in enumerate(structured_patterns):
-                matches = re.finditer(pattern, text_content, re.IGNORECASE)
+            for pattern_idx, pattern in enumerate(_STRUCTURED_PATTERNS):
+                matches = pattern.finditer(text_content)
                 
                 for match_idx, match in enumerate(matches):
                     if len(extracted_values) >= 5:  # Limite par élément
@@ -719,16 +1139,18 @@ class CohesiveTunisianWebScraper:
                         if numeric_value is not None:
                             unit = unit_hint or self._determine_unit_from_context(indicator_name, numeric_value)
                             
-                            key = f"struct_{elem_idx}_{pattern_idx}_{match_idx}"
-                            extracted_values[key] = self._create_enhanced_value_cohesive(
+                            value_data = self._create_enhanced_value_cohesive(
                                 value=numeric_value,
                                 name=indicator_name[:60],
                                 unit=unit,
                                 raw_text=match.group(0),
                                 method="html_structured",
                                 url=url,
-                                confidence=0.75
+                                confidence=0.75,
+                                timestamp=extraction_timestamp
                             )
+                            if value_data is not None:
+                                extracted_values[f"struct_{elem_idx}_{pattern_idx}_{match_idx}"] = value_data
         
         except Exception as e:
             logger.error(f"Structured element extraction error: {e}")
@@ -737,41 +1159,52 @@ class CohesiveTunisianWebScraper:
 
     def _extract_patterns_comprehensive(self, content: str, url: str) -> Dict[str, Any]:
         """Extraction par patterns comprehensive"""
-        extracted_values = {}
+        extracted_values = dict(self._iter_pattern_values(content, url))
+        logger.info(f"Pattern extraction: {len(extracted_values)} values")
+        return extracted_values
+
+    def _iter_pattern_values(self, content: str, url: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Générateur (clé, valeur) des correspondances de patterns - consommé à la demande"""
+        extraction_timestamp = datetime.utcnow().isoformat()
+        
+        max_matches_per_pattern = 15  # Limite par pattern
+        match_counts = [0] * len(self.modern_patterns)
+        patterns_open = len(_MODERN_GROUP_TABLE)
         
         try:
-            for pattern_idx, pattern in enumerate(self.modern_patterns):
-                matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
+            for pattern_idx, groups, raw_text in _iter_modern_matches(content):
+                match_idx = match_counts[pattern_idx]
+                if match_idx >= max_matches_per_pattern:
+                    continue
                 
-                for match_idx, match in enumerate(matches):
-                    if match_idx >= 15:  # Limite par pattern
-                        break
-                    
-                    groups = match.groups()
-                    if len(groups) >= 2:
-                        name = groups[0].strip()
-                        value_str = groups[1].strip()
-                        unit = groups[2].strip() if len(groups) > 2 else ''
-                        
-                        numeric_value = self._parse_numeric_european(value_str)
-                        if numeric_value is not None and self._is_economic_value(numeric_value, name):
-                            key = f"pattern_{pattern_idx}_{match_idx}"
-                            extracted_values[key] = self._create_enhanced_value_cohesive(
-                                value=numeric_value,
-                                name=name[:60],
-                                unit=unit[:10],
-                                raw_text=match.group(0),
-                                method="pattern_modern",
-                                url=url,
-                                confidence=0.7
-                            )
-            
-            logger.info(f"Pattern extraction: {len(extracted_values)} values")
+                match_counts[pattern_idx] += 1
+                if match_counts[pattern_idx] == max_matches_per_pattern:
+                    patterns_open -= 1
+                
+                name = groups[0].strip()
+                value_str = groups[1].strip()
+                unit = (groups[2] or '').strip() if len(groups) > 2 else ''
+                
+                numeric_value = self._parse_numeric_european(value_str)
+                if numeric_value is not None and self._is_economic_value(numeric_value, name):
+                    value_data = self._create_enhanced_value_cohesive(
+                        value=numeric_value,
+                        name=name[:60],
+                        unit=unit[:10],
+                        raw_text=raw_text,
+                        method="pattern_modern",
+                        url=url,
+                        confidence=0.7,
+                        timestamp=extraction_timestamp
+                    )
+                    if value_data is not None:
+                        yield f"pattern_{pattern_idx}_{match_idx}", value_data
+                
+                if not patterns_open:
+                    break
             
         except Exception as e:
             logger.error(f"Pattern extraction error: {e}")
-        
-        return extracted_values
 
     def _apply_comprehensive_post_processing(self, extracted_data: Dict[str, Any], 
                                            content: str, url: str) -> Dict[str, Any]:
@@ -817,10 +1250,11 @@ class CohesiveTunisianWebScraper:
                 # Garder les données filtrées si validation échoue
                 for i, filtered_item in enumerate(filtered_values_list):
                     key = f"filtered_{i}"
-                    validated_values[key] = filtered_item
+                    validated_values[key] = self._finalize_enhanced_value(filtered_item)
                 logger.warning("Validation failed, keeping filtered data")
             
             # 5. Enrichissement final
+            validated_count = len(validated_values)
             final_values = self._enrich_validated_values(validated_values, url)
             
             return {
@@ -831,7 +1265,7 @@ class CohesiveTunisianWebScraper:
                     'enrichment_applied': True,
                     'original_count': len(values),
                     'filtered_count': len(filtered_values_list),
-                    'validated_count': len(validated_values),
+                    'validated_count': validated_count,
                     'final_count': len(final_values),
                     'validation_summary': validation_result.get('summary', {}),
                     'processing_timestamp': datetime.utcnow().isoformat()
@@ -841,94 +1275,86 @@ class CohesiveTunisianWebScraper:
         except Exception as e:
             logger.error(f"Post-processing failed: {e}")
             # En cas d'échec, retourner les données originales
+            for value_data in values.values():
+                if isinstance(value_data, dict):
+                    self._finalize_enhanced_value(value_data)
             return extracted_data
 
     def _create_enhanced_value_cohesive(self, value: float, name: str, unit: str, 
                                       raw_text: str, method: str, url: str,
-                                      confidence: float = 0.7, year: int = None) -> Dict[str, Any]:
-        """Création de valeur enrichie cohésive avec tous les modules"""
+                                      confidence: float = 0.7, year: int = None,
+                                      timestamp: str = None) -> Dict[str, Any]:
+        """Création de valeur cohésive - enrichissement différé à _finalize_enhanced_value"""
         
         # Validation économique
         if not self._validate_economic_value_cohesive(value, name):
             return None
         
-        # Année par défaut
+        # Année par défaut (requise par temporal_filter / data_validator)
         if year is None:
             year = self._extract_year_from_context(raw_text, name) or 2024
         
-        # Catégorisation
-        category = self._categorize_indicator_cohesive(name)
-        
         return {
             "value": value,
             "raw_text": raw_text[:200],
             "indicator_name": name.strip(),
             "enhanced_indicator_name": f"[COHESIVE] {name.strip()}",
-            "category": category,
             "unit": unit.strip(),
-            "unit_description": self._get_unit_description(unit),
             "context_text": raw_text[:150],
             "extraction_method": method,
-            "source_domain": extract_domain(url),
-            "extraction_timestamp": datetime.utcnow().isoformat(),
+            "source_domain": _source_domain(url),
+            "extraction_timestamp": timestamp or datetime.utcnow().isoformat(),
             "confidence_score": confidence,
             "is_economic_indicator": True,
-            "is_target_indicator": self._is_target_indicator_cohesive(name),
             "validated": True,
             "year": year,
             "period_type": "annual",
             "temporal_context": f"{year}-cohesive",
             "quality_score": confidence,
-            "semantic_quality": self._calculate_semantic_quality(name, value, unit),
             "cohesive_processing": True
         }
 
+    def _finalize_enhanced_value(self, value_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Enrichissement différé (catégorie, unité, qualité) des valeurs ayant survécu au filtrage"""
+        if 'category' in value_data:
+            return value_data
+        
+        name = value_data.get('indicator_name', '')
+        unit = value_data.get('unit', '')
+        
+        value_data['category'] = self._categorize_indicator_cohesive(name)
+        value_data['unit_description'] = self._get_unit_description(unit)
+        value_data['is_target_indicator'] = self._is_target_indicator_cohesive(name)
+        value_data['semantic_quality'] = self._calculate_semantic_quality(name, value_data.get('value', 0), unit)
+        return value_data
+
     def _validate_economic_value_cohesive(self, value: float, name: str) -> bool:
         """Validation économique cohésive"""
         
+        name_lower = name.lower()
+        
         # Rejeter les années évidentes
         if 1950 <= value <= 2030 and len(str(int(value))) == 4:
-            year_indicators = ['year', 'année', 'date', 'période']
-            if any(year_ind in name.lower() for year_ind in year_indicators):
+            if _YEAR_WORD_RE.search(name_lower):
                 return False
         
         # Validation permissive par type
-        name_lower = name.lower()
-        
-        if any(rate_word in name_lower for rate_word in ['taux', 'rate', '%', 'croissance']):
+        if _RATE_WORD_RE.search(name_lower):
             return -100 <= value <= 1000
         elif 'population' in name_lower:
             return 1000 <= value <= 50_000_000
-        elif any(gdp_word in name_lower for gdp_word in ['pib', 'gdp', 'dette']):
+        elif _GDP_WORD_RE.search(name_lower):
             return 0 <= value < 1e15
         else:
             return abs(value) < 1e12
 
     def _categorize_indicator_cohesive(self, name: str) -> str:
         """Catégorisation cohésive des indicateurs"""
-        name_lower = name.lower()
-        
-        for category, keywords in self.tunisian_indicators.items():
-            if any(keyword in name_lower for keyword in keywords):
-                category_mapping = {
-                    'monetary': 'MONETARY',
-                    'statistical': 'DEMOGRAPHIC',
-                    'trade': 'TRADE',
-                    'fiscal': 'FISCAL',
-                    'financial': 'FINANCIAL'
-                }
-                return category_mapping.get(category, 'OTHER')
-        
-        return 'OTHER'
+        return _categorize_indicator_name(name)
 
     def _is_target_indicator_cohesive(self, name: str) -> bool:
         """Détection des indicateurs cibles"""
-        name_lower = name.lower()
-        target_keywords = [
-            'pib', 'gdp', 'inflation', 'taux directeur', 'chômage',
-            'population', 'dette', 'export', 'import', 'balance'
-        ]
-        return any(keyword in name_lower for keyword in target_keywords)
+        return _is_target_indicator_name(name)
 
     def _calculate_semantic_quality(self, name: str, value: float, unit: str) -> float:
         """Calcul de qualité sémantique"""
@@ -947,9 +1373,7 @@ class CohesiveTunisianWebScraper:
 
     def _extract_year_from_context(self, raw_text: str, name: str) -> Optional[int]:
         """Extraction d'année depuis le contexte"""
-        combined_text = f"{raw_text} {name}".lower()
-        
-        year_match = re.search(r'\b(20[1-2][0-9])\b', combined_text)
+        year_match = _YEAR_RE.search(raw_text) or _YEAR_RE.search(name)
         if year_match:
             year = int(year_match.group(1))
             if 2018 <= year <= 2025:
@@ -960,7 +1384,7 @@ class CohesiveTunisianWebScraper:
     def _parse_numeric_european(self, text: str) -> Optional[float]:
         """Parsing numérique format européen"""
         try:
-            clean_text = re.sub(r'[^\d\s,\.\-]', '', text.strip())
+            clean_text = text.strip().translate(_NUMERIC_CHAR_TABLE)
             if not clean_text:
                 return None
             
@@ -984,8 +1408,7 @@ class CohesiveTunisianWebScraper:
         if unit_hint:
             return unit_hint.upper()
         
-        indicator_lower = indicator.lower()
-        if any(word in indicator_lower for word in ['taux', 'rate']):
+        if _BCT_RATE_WORD_RE.search(indicator.lower()):
             return '%'
         elif value > 1000:
             return 'MD'
@@ -996,9 +1419,9 @@ class CohesiveTunisianWebScraper:
         """Détermination d'unité INS"""
         indicator_lower = indicator.lower()
         
-        if any(word in indicator_lower for word in ['épargne', 'formation', 'capital']):
+        if _INS_STOCK_WORD_RE.search(indicator_lower):
             return 'MD' if value > 1000 else 'MDT'
-        elif any(word in indicator_lower for word in ['taux', 'croissance']):
+        elif _INS_RATE_WORD_RE.search(indicator_lower):
             return '%'
         elif 'population' in indicator_lower:
             return 'habitants'
@@ -1009,9 +1432,9 @@ class CohesiveTunisianWebScraper:
         """Détermination d'unité depuis le contexte"""
         indicator_lower = indicator.lower()
         
-        if any(word in indicator_lower for word in ['taux', '%', 'croissance']):
+        if _CONTEXT_RATE_WORD_RE.search(indicator_lower):
             return '%'
-        elif any(word in indicator_lower for word in ['pib', 'budget', 'dette']):
+        elif _CONTEXT_AMOUNT_WORD_RE.search(indicator_lower):
             return 'MD' if value > 100 else 'MDT'
         elif 'population' in indicator_lower:
             return 'habitants'
@@ -1022,42 +1445,19 @@ class CohesiveTunisianWebScraper:
         """Extraction d'unité depuis le texte"""
         combined_text = f"{value_text} {label_text}".lower()
         
-        unit_patterns = {
-            r'%|pourcent': '%',
-            r'md|millions?\s*de?\s*dinars?': 'MD',
-            r'milliards?': 'MD',
-            r'usd|dollars?': 'USD',
-            r'eur|euros?': 'EUR',
-            r'habitants?': 'habitants'
-        }
-        
-        for pattern, unit in unit_patterns.items():
-            if re.search(pattern, combined_text):
+        for pattern, unit in _UNIT_PATTERNS:
+            if pattern.search(combined_text):
                 return unit
         
         return ''
 
     def _get_unit_description(self, unit: str) -> str:
         """Description d'unité"""
-        descriptions = {
-            'MD': 'Millions de Dinars',
-            'MDT': 'Millions de Dinars Tunisiens',
-            '%': 'Pourcentage',
-            'USD': 'Dollars Américains',
-            'EUR': 'Euros',
-            'TND': 'Dinars Tunisiens',
-            'habitants': 'Nombre d\'habitants'
-        }
-        return descriptions.get(unit.upper(), unit)
+        return _UNIT_DESCRIPTIONS.get(unit.upper(), unit)
 
     def _is_economic_indicator_ins(self, text: str) -> bool:
         """Vérification indicateur économique INS"""
-        text_lower = text.lower()
-        ins_keywords = [
-            'épargne', 'formation', 'capital', 'investissement',
-            'population', 'emploi', 'chômage', 'entreprises'
-        ]
-        return any(keyword in text_lower for keyword in ins_keywords)
+        return _INS_KEYWORD_RE.search(text.lower()) is not None
 
     def _is_economic_indicator_table(self, text: str) -> bool:
         """Vérification indicateur économique table"""
@@ -1075,24 +1475,12 @@ class CohesiveTunisianWebScraper:
         text_lower = text.lower()
         
         # Exclure les éléments non économiques
-        exclude_patterns = [
-            r'^(table|tableau|total|somme)',
-            r'^(année|year|date)',
-            r'^[0-9]{4}',  # Années seules
-        ]
-        
-        for pattern in exclude_patterns:
-            if re.match(pattern, text_lower):
+        for pattern in _EXCLUSION_PATTERNS:
+            if pattern.match(text_lower):
                 return False
         
         # Vérifier les mots-clés économiques
-        economic_keywords = [
-            'pib', 'gdp', 'inflation', 'taux', 'dette', 'budget',
-            'population', 'emploi', 'chômage', 'export', 'import',
-            'réserves', 'change', 'crédit', 'épargne', 'formation'
-        ]
-        
-        return any(keyword in text_lower for keyword in economic_keywords)
+        return _ECONOMIC_KEYWORD_RE.search(text_lower) is not None
 
     def _is_economic_value(self, value: float, context: str) -> bool:
         """Validation rapide de valeur économique"""
@@ -1133,22 +1521,26 @@ class CohesiveTunisianWebScraper:
         }
 
     def _enrich_validated_values(self, validated_values: Dict[str, Any], url: str) -> Dict[str, Any]:
-        """Enrichissement final des valeurs validées"""
-        enriched_values = {}
+        """Enrichissement final des valeurs validées (en place : le dict appelant est réutilisé)"""
+        processing_timestamp = datetime.utcnow().isoformat()
+        non_dict_keys = []
         
         for key, value_data in validated_values.items():
             if isinstance(value_data, dict):
                 # Enrichir avec métadonnées cohésives
                 value_data['cohesive_enrichment'] = {
-                    'processing_timestamp': datetime.utcnow().isoformat(),
+                    'processing_timestamp': processing_timestamp,
                     'enrichment_version': 'cohesive_v1.0',
                     'all_utils_applied': True,
                     'source_url': url
                 }
-                
-                enriched_values[key] = value_data
+            else:
+                non_dict_keys.append(key)
         
-        return enriched_values
+        for key in non_dict_keys:
+            del validated_values[key]
+        
+        return validated_values
 
     def _save_via_smart_storage(self, result: ScrapedContent, url: str):
         """Sauvegarde via le système de stockage intégré"""
@@ -1224,11 +1616,27 @@ class CohesiveTunisianWebScraper:
         values = post_processed_data.get('values', {})
         post_processing_info = post_processed_data.get('post_processing', {})
         
+        # Statistiques de qualité en une seule passe
+        categories = set()
+        target_count = 0
+        high_quality_count = 0
+        confidence_sum = 0.0
+        for v in values.values():
+            if not isinstance(v, dict):
+                continue
+            categories.add(v.get('category'))
+            if v.get('is_target_indicator', False):
+                target_count += 1
+            confidence = v.get('confidence_score', 0)
+            confidence_sum += confidence
+            if confidence > 0.8:
+                high_quality_count += 1
+        
         # Résumé d'extraction cohésif
         extraction_summary = ExtractionSummary(
             total_values=len(values),
-            categories_found=len(set(v.get('category') for v in values.values() if isinstance(v, dict))),
-            target_indicators_found=sum(1 for v in values.values() if isinstance(v, dict) and v.get('is_target_indicator', False)),
+            categories_found=len(categories),
+            target_indicators_found=target_count,
             validated_indicators=len(values),
             extraction_method="cohesive_traditional",
             processing_time=execution_time
@@ -1237,10 +1645,10 @@ class CohesiveTunisianWebScraper:
         # Qualité d'extraction cohésive
         extraction_quality = ExtractionQuality(
             total_extracted=post_processing_info.get('original_count', 0),
-            high_quality_count=sum(1 for v in values.values() if isinstance(v, dict) and v.get('confidence_score', 0) > 0.8),
-            target_indicators_found=extraction_summary.target_indicators_found,
-            categories_covered=extraction_summary.categories_found,
-            average_confidence=sum(v.get('confidence_score', 0) for v in values.values() if isinstance(v, dict)) / len(values) if values else 0
+            high_quality_count=high_quality_count,
+            target_indicators_found=target_count,
+            categories_covered=len(categories),
+            average_confidence=confidence_sum / len(values) if values else 0
         )
         
         # Informations de traitement cohésives
@@ -1346,6 +1754,9 @@ class CohesiveTunisianWebScraper:
             "session_active": self.session is not None,
             "pdf_available": PDF_AVAILABLE,
             "excel_available": EXCEL_AVAILABLE,
+            "selectolax_available": SELECTOLAX_AVAILABLE,
+            "orjson_available": ORJSON_AVAILABLE,
+            "hyperscan_active": _MODERN_HS_DATABASE is not None,
             "timeout_configured": self.timeout,
             "patterns_loaded": len(self.modern_patterns),
             "module_usage_stats": self.module_usage,
@@ -1353,10 +1764,12 @@ class CohesiveTunisianWebScraper:
         }
 
     def close(self):
-        """Fermeture propre des ressources"""
+        """Libération de la session (la session partagée reste ouverte pour les autres instances)"""
         if hasattr(self, 'session') and self.session:
-            self.session.close()
-            logger.info("Cohesive scraper session closed")
+            if self.session is not _shared_session:
+                self.session.close()
+            self.session = None
+            logger.info("Cohesive scraper session released")
 
 # Alias pour compatibilité avec le reste du système
 TunisianWebScraper = CohesiveTunisianWebScraper
\ No newline at end of file
@@ -4,25 +4,126 @@ VERSION CORRIGÉE avec fixes critiques pour éviter les tâches bloquées
 """
 
 from typing import List, Dict, Any, Optional
+import json
 import logging
 import traceback
-from datetime import datetime
-from sqlalchemy import update
-import signal
+from datetime import datetime, timedelta
+from sqlalchemy import update, select, func, text, bindparam, or_, and_
+from celery import chord, group
+from celery.exceptions import SoftTimeLimitExceeded
+from pydantic import BaseModel
+from celery.signals import worker_process_init, worker_process_shutdown
+import os
+from functools import partial, lru_cache
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 
-from app.models.database import ScrapingTask, get_db_session
+from app.models.database import ScrapingTask, TaskSession, get_db_session, cleanup_old_tasks
 from app.agents.smart_coordinator import SmartScrapingCoordinator
+from app.utils.task_progress import start_progress, increment_progress, finish_progress
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Nombre maximal d'URLs scrapées simultanément par tâche (I/O réseau)
+MAX_URL_WORKERS = int(os.getenv("SCRAPE_URL_CONCURRENCY", "8"))
+
+# Intervalle minimal (secondes) entre deux écritures de progression en base
+PROGRESS_WRITE_INTERVAL = 2.0
+
+# Nombre de résultats en attente déclenchant une écriture avant l'intervalle
+PROGRESS_FLUSH_EVERY = 10
+
+# Délai maximal (ms) d'une requête du health check côté PostgreSQL
+HEALTH_CHECK_STATEMENT_TIMEOUT_MS = 5000
+
+# Taille de l'aperçu du contenu brut conservé dans les résultats
+RAW_CONTENT_PREVIEW_CHARS = 5000
+
+# Statuts depuis lesquels une exécution peut prendre la tâche ('failed' : retry Celery).
+# Une tâche 'running' n'est reprise que si son exécution a dépassé la limite dure
+# (worker perdu puis redélivrance via task_reject_on_worker_lost)
+CLAIMABLE_TASK_STATUSES = ('pending', 'failed')
+
+# Limite dure (secondes) de smart_scraping_task, hors surcharge par apply_async
+SMART_TASK_TIME_LIMIT = 600
+
+# Ancienneté (jours) au-delà de laquelle les tâches terminées sont purgées
+TASK_RETENTION_DAYS = int(os.getenv("TASK_RETENTION_DAYS", "30"))
+
+# Stratégies reconnues pour les statistiques de distribution
+VALID_STRATEGIES = ("traditional", "intelligent")
+_STRATEGY_METHODS = {strategy: f"corrected_{strategy}" for strategy in VALID_STRATEGIES}
+
+# Squelette d'un résultat réussi (clés dans l'ordre final, champs par URL remplis ensuite)
+_SUCCESS_CORRECTIONS = (
+    "timeout_protection",
+    "strategy_validation",
+    "robust_error_handling",
+    "permissive_thresholds"
+)
+_SUCCESS_RESULT_SHELL = {
+    "url": None,
+    "success": True,
+    "status_code": 200,
+    "content": None,
+    "strategy_used": None,
+    "method": None,
+    "llm_analysis": None,
+    "processing_time": 0.0,
+    "timestamp": None,
+    "confidence_score": 0.8,
+    "extraction_count": 0,
+    "quality_metrics": None,
+    "corrections_applied": _SUCCESS_CORRECTIONS
+}
+
 def get_celery_app():
     """Fonction helper pour obtenir l'app Celery de manière différée"""
     from app.celery_app import celery_app
     return celery_app
 
+# Méthode de sérialisation pydantic résolue une fois (v2 : model_dump, v1 : dict)
+_dump_model = BaseModel.model_dump if hasattr(BaseModel, 'model_dump') else BaseModel.dict
+
+def _dump_object(obj):
+    """Dictionnaire d'un objet non natif : modèles pydantic d'abord, puis méthode dict() éventuelle"""
+    if isinstance(obj, BaseModel):
+        return _dump_model(obj)
+    dump = getattr(obj, 'model_dump', None) or getattr(obj, 'dict', None)
+    if dump is None:
+        raise TypeError(type(obj).__name__)
+    return dump()
+
+def _json_default(obj):
+    """Types non natifs pour orjson (modèles pydantic, ensembles, objets divers)"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    try:
+        return _dump_object(obj)
+    except Exception:
+        return str(obj)
+
 def make_json_serializable(obj):
     """Assure que l'objet est JSON-serializable"""
+    if ORJSON_AVAILABLE:
+        # Parcours en C ; le repli récursif ne sert que si orjson rejette la structure
+        try:
+            return orjson.loads(orjson.dumps(
+                obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        except TypeError:
+            pass
+    return _make_json_serializable_py(obj)
+
+def _make_json_serializable_py(obj):
+    """Conversion récursive en Python pur (repli sans orjson)"""
     if obj is None:
         return None
     elif isinstance(obj, (bool, int, float, str)):
@@ -30,56 +131,412 @@ def make_json_serializable(obj):
     elif isinstance(obj, datetime):
         return obj.isoformat()
     elif isinstance(obj, dict):
-        return {str(k): make_json_serializable(v) for k, v in obj.items()}
+        return {str(k): _make_json_serializable_py(v) for k, v in obj.items()}
     elif isinstance(obj, (list, tuple, set)):
-        return [make_json_serializable(item) for item in obj]
-    elif hasattr(obj, 'dict'):
-        try:
-            return make_json_serializable(obj.dict())
-        except:
-            return str(obj)
-    elif hasattr(obj, 'model_dump'):
+        return [_make_json_serializable_py(item) for item in obj]
+    else:
         try:
-            return make_json_serializable(obj.model_dump())
-        except:
+            return _make_json_serializable_py(_dump_object(obj))
+        except Exception:
             return str(obj)
-    else:
-        return str(obj)
 
 class TimeoutHandler:
-    """Gestionnaire de timeout pour éviter les tâches bloquées"""
+    """Budget de temps d'une tâche, sans signal.
+    
+    SIGALRM ne fonctionne que dans le thread principal et une alarme imbriquée
+    écrase la précédente : le budget est donc suivi par échéance monotone, et les
+    appels bloquants sont bornés via run_with_timeout (future.result(timeout=...)).
+    """
     
     def __init__(self, timeout_seconds: int):
         self.timeout_seconds = timeout_seconds
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = time.time()
-        signal.signal(signal.SIGALRM, self._timeout_handler)
-        signal.alarm(self.timeout_seconds)
+        self.start_time = time.monotonic()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        signal.alarm(0)
         return False
     
-    def _timeout_handler(self, signum, frame):
-        elapsed = time.time() - self.start_time if self.start_time else 0
-        raise TimeoutError(f"Task timed out after {elapsed:.1f}s (limit: {self.timeout_seconds}s)")
+    def elapsed(self) -> float:
+        """Temps écoulé depuis l'entrée dans le contexte"""
+        return time.monotonic() - self.start_time if self.start_time else 0.0
+    
+    def remaining(self, fraction: float = 1.0) -> float:
+        """Temps restant sur la fraction donnée du budget"""
+        return self.timeout_seconds * fraction - self.elapsed()
     
     def check_timeout(self):
         """Vérification manuelle du timeout"""
         if self.start_time:
-            elapsed = time.time() - self.start_time
+            elapsed = self.elapsed()
             if elapsed > self.timeout_seconds:
                 raise TimeoutError(f"Task manually timed out after {elapsed:.1f}s")
 
+# Pool partagé pour borner les appels bloquants (créé à la première utilisation)
+_timeout_executor: Optional[ThreadPoolExecutor] = None
+_timeout_executor_lock = threading.Lock()
+
+def run_with_timeout(fn, timeout_seconds: float, *args, **kwargs):
+    """Exécute fn dans un thread et lève TimeoutError si le résultat n'arrive pas à temps"""
+    global _timeout_executor
+    
+    if _timeout_executor is None:
+        with _timeout_executor_lock:
+            if _timeout_executor is None:
+                _timeout_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="task-timeout")
+    
+    future = _timeout_executor.submit(fn, *args, **kwargs)
+    try:
+        return future.result(timeout=timeout_seconds)
+    except FuturesTimeoutError:
+        future.cancel()
+        raise TimeoutError(f"{getattr(fn, '__name__', 'call')} timed out after {timeout_seconds}s")
+
+# Coordinateur partagé par processus worker (reconstruit après fork)
+_coordinator: Optional[SmartScrapingCoordinator] = None
+_coordinator_pid: Optional[int] = None
+_coordinator_lock = threading.Lock()
+
+def _get_coordinator() -> SmartScrapingCoordinator:
+    """Coordinateur construit une seule fois par processus"""
+    global _coordinator, _coordinator_pid
+    
+    pid = os.getpid()
+    if _coordinator is None or _coordinator_pid != pid:
+        with _coordinator_lock:
+            if _coordinator is None or _coordinator_pid != pid:
+                _coordinator = SmartScrapingCoordinator()
+                _coordinator_pid = pid
+    return _coordinator
+
+@worker_process_init.connect
+def _warm_coordinator(**kwargs):
+    """Construction anticipée après le fork : la première tâche ne paie pas l'initialisation"""
+    try:
+        _get_coordinator()
+        logger.info("Smart coordinator initialized for worker process")
+    except Exception as e:
+        logger.warning(f"Coordinator warm-up failed (will retry on first task): {e}")
+
+@worker_process_shutdown.connect
+def _close_http_pool(**kwargs):
+    """Libère les connexions keep-alive partagées à l'arrêt du processus worker"""
+    try:
+        from app.scrapers.traditional import close_shared_session
+        close_shared_session()
+    except Exception as e:
+        logger.debug(f"HTTP pool shutdown skipped: {e}")
+
+@lru_cache(maxsize=16)
+def _task_update_stmt(columns: frozenset, guarded: bool = False):
+    """UPDATE paramétré par jeu de colonnes, construit une fois (clé de cache SQL stable).
+    
+    guarded=True ajoute une condition sur le statut courant (paramètre 'expected_status') :
+    rowcount vaut 0 si la tâche a changé d'état entre-temps (annulation).
+    """
+    stmt = update(ScrapingTask).where(ScrapingTask.task_id == bindparam('tid'))
+    if guarded:
+        stmt = stmt.where(ScrapingTask.status == bindparam('expected_status'))
+    return stmt.values({
+        column: bindparam(f'v_{column}', type_=ScrapingTask.__table__.c[column].type)
+        for column in columns
+    })
+
+def _task_update_params(task_id: str, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Paramètres liés de _task_update_stmt"""
+    params = {f'v_{column}': value for column, value in values.items()}
+    params['tid'] = task_id
+    return params
+
+def _update_task(task_id: str, **values):
+    """UPDATE de la ligne de tâche via la session à portée de tâche (une connexion par tâche)"""
+    db = TaskSession()
+    try:
+        db.execute(_task_update_stmt(frozenset(values)), _task_update_params(task_id, values))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+@lru_cache(maxsize=4)
+def _task_claim_stmt(columns: frozenset):
+    """UPDATE de prise en charge : depuis un statut CLAIMABLE_TASK_STATUSES, ou 'running'
+    démarré avant 'stale_before' (exécution précédente tuée par la limite dure)"""
+    return _task_update_stmt(columns).where(or_(
+        ScrapingTask.status.in_(CLAIMABLE_TASK_STATUSES),
+        and_(ScrapingTask.status == 'running', ScrapingTask.started_at < bindparam('stale_before'))
+    ))
+
+def _claim_task(task_id: str, hard_time_limit: float, **values) -> bool:
+    """Passe la tâche en cours en une instruction.
+    
+    False si elle est terminée, annulée ou déjà prise par une exécution encore vivante
+    (deux livraisons simultanées du même message ne scrapent pas deux fois).
+    """
+    params = _task_update_params(task_id, values)
+    params['stale_before'] = datetime.utcnow() - timedelta(seconds=hard_time_limit)
+    db = TaskSession()
+    try:
+        claimed = db.execute(_task_claim_stmt(frozenset(values)), params).rowcount == 1
+        db.commit()
+        return claimed
+    except Exception:
+        db.rollback()
+        raise
+
+def _record_task_failure(task_id: str, status: str, error_msg: str):
+    """Statut d'échec écrit sur la session de la tâche, sans masquer l'exception d'origine"""
+    db = TaskSession()
+    try:
+        # La transaction courante peut être invalide si la base est à l'origine de l'échec
+        db.rollback()
+        db.execute(
+            _task_update_stmt(frozenset(('status', 'completed_at', 'error'))),
+            _task_update_params(task_id, {
+                'status': status, 'completed_at': datetime.utcnow(), 'error': error_msg
+            })
+        )
+        db.commit()
+    except Exception as db_error:
+        db.rollback()
+        logger.error(f"Failed to record {status} status for {task_id}: {db_error}")
+    finish_progress(task_id)
+
+def _finalize_task(task_id: str, new_results: List[Dict[str, Any]], **values) -> bool:
+    """UPDATE final de la tâche, seulement si elle est toujours 'running' (une transaction).
+    
+    new_results ne contient que les résultats pas encore ajoutés au fil de l'eau : sous
+    PostgreSQL ils complètent la colonne results, ailleurs (aucun ajout en cours de tâche)
+    ils la remplissent. Retourne False si la tâche n'est plus 'running' (annulée pendant
+    l'exécution : rien n'est écrit).
+    """
+    db = TaskSession()
+    append = db.get_bind().dialect.name == 'postgresql'
+    if not append:
+        values = dict(values, results=new_results)
+    params = _task_update_params(task_id, values)
+    params['expected_status'] = 'running'
+    try:
+        updated = db.execute(_task_update_stmt(frozenset(values), guarded=True), params)
+        if updated.rowcount != 1:
+            db.rollback()
+            return False
+        if append and new_results:
+            db.execute(_APPEND_FINAL_RESULTS_STMT, {"items": _dumps_json(new_results), "tid": task_id})
+        db.commit()
+        return True
+    except Exception:
+        db.rollback()
+        raise
+
+# Ajout incrémental au tableau results (PostgreSQL) : coût proportionnel aux éléments ajoutés.
+# Ordre d'ajout = ordre de complétion : chaque élément porte url_index pour le tri à la lecture
+_APPEND_RESULTS_SQL = "results = (coalesce(results::jsonb, '[]'::jsonb) || CAST(:items AS jsonb))::json"
+_APPEND_RESULTS_STMT = text(
+    f"UPDATE scraping_tasks SET {_APPEND_RESULTS_SQL}, progress = CAST(:progress AS json) "
+    "WHERE task_id = :tid"
+)
+_APPEND_FINAL_RESULTS_STMT = text(f"UPDATE scraping_tasks SET {_APPEND_RESULTS_SQL} WHERE task_id = :tid")
+
+def _dumps_json(obj: Any) -> str:
+    """Texte JSON d'un objet (paramètre SQL)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        ).decode('utf-8')
+    return json.dumps(make_json_serializable(obj))
+
+def _append_task_results(task_id: str, items: List[Dict[str, Any]], progress: Dict[str, Any]) -> bool:
+    """Ajoute les résultats terminés à la colonne results et écrit la progression.
+    
+    Une transaction par lot. Hors PostgreSQL, seule la progression est écrite :
+    la colonne results l'est en fin de tâche. Retourne True si les éléments ont été ajoutés.
+    """
+    db = TaskSession()
+    try:
+        appended = bool(items) and db.get_bind().dialect.name == 'postgresql'
+        if appended:
+            db.execute(_APPEND_RESULTS_STMT, {
+                "items": _dumps_json(items),
+                "progress": _dumps_json(progress),
+                "tid": task_id
+            })
+        else:
+            db.execute(
+                _task_update_stmt(frozenset(('progress',))),
+                _task_update_params(task_id, {'progress': progress})
+            )
+        db.commit()
+        return appended
+    except Exception:
+        db.rollback()
+        raise
+
+def _load_coordinator_status() -> Dict[str, Any]:
+    """Statut du coordinateur (exécuté sous run_with_timeout)"""
+    return _get_coordinator().get_coordinator_status()
+
+def _count_scraping_tasks():
+    """Compteurs (total, actives, du jour) des tâches de scraping en un seul aller-retour"""
+    with get_db_session() as db:
+        # Le health check ne doit jamais rester bloqué sur une table verrouillée
+        if db.get_bind().dialect.name == 'postgresql':
+            db.execute(text(f"SET LOCAL statement_timeout = {HEALTH_CHECK_STATEMENT_TIMEOUT_MS}"))
+        
+        row = db.execute(_TASK_COUNTS_STMT).one()
+    return row.total, row.active, row.today
+
+# Agrégation conditionnelle : total, actives et du jour en une requête
+_TASK_COUNTS_STMT = select(
+    func.count().label('total'),
+    func.count().filter(ScrapingTask.status.in_(['pending', 'running'])).label('active'),
+    func.count().filter(ScrapingTask.created_at >= func.current_date()).label('today'),
+).select_from(ScrapingTask)
+
+def _resolve_scrape_fn(coordinator, enable_llm_analysis: bool,
+                       quality_threshold: float, single_url_timeout: int):
+    """Méthode de scraping résolue une fois par tâche (LangGraph si disponible)"""
+    # Support LangGraph pour le superviseur
+    if hasattr(coordinator, 'scrape_with_langgraph'):
+        logger.debug("Using LangGraph-enabled scraping")
+        return partial(coordinator.scrape_with_langgraph, enable_llm_analysis=enable_llm_analysis)
+    
+    logger.debug("Using standard coordinator scraping")
+    # Le timeout par URL est appliqué au niveau socket par le coordinateur
+    return partial(
+        coordinator.scrape,
+        enable_llm_analysis=enable_llm_analysis,
+        quality_threshold=quality_threshold,
+        timeout=single_url_timeout
+    )
+
+def _summarize(structured_data: Any, metadata: Dict[str, Any]):
+    """(nombre de valeurs extraites, champs structurés, présence d'analyse LLM)"""
+    structured = structured_data if isinstance(structured_data, dict) else {}
+    extracted_values = structured.get('extracted_values')
+    return (
+        len(extracted_values) if isinstance(extracted_values, dict) else 0,
+        len(structured),
+        bool(metadata.get('llm_analysis'))
+    )
+
+def _scrape_one(scrape_fn, url: str):
+    """Scraping d'une URL (exécuté dans un thread du pool).
+    
+    Retourne (result_dict, strategy_used) ; strategy_used vaut None en cas d'échec.
+    """
+    url_start_mono = time.monotonic()
+    logger.debug("🎯 Processing URL: %s", url)
+    
+    scrape_result = None
+    try:
+        scrape_result = scrape_fn(url=url)
+    except SoftTimeLimitExceeded:
+        # Thread principal (scrape_url_task) : la limite Celery n'est pas un échec de scraping
+        raise
+    except Exception as scrape_error:
+        logger.error("❌ Scraping error for %s: %s", url, scrape_error)
+        scrape_result = None
+    
+    url_processing_time = time.monotonic() - url_start_mono
+    now_iso = datetime.utcnow().isoformat()
+    
+    # CORRECTION CRITIQUE: Validation du résultat avec logs détaillés
+    if not (scrape_result and hasattr(scrape_result, 'structured_data')):
+        logger.warning("⚠️ No valid result from coordinator for: %s", url)
+        return {
+            "url": url,
+            "success": False,
+            "status_code": 500,
+            "error": "Coordinator returned no valid content",
+            "strategy_used": "failed",
+            "method": "coordinator_failed",
+            "timestamp": now_iso
+        }, None
+    
+    logger.debug("✅ Scrape result received for %s", url)
+    
+    # Extraction sécurisée des données
+    try:
+        structured_data = scrape_result.structured_data or {}
+        metadata = scrape_result.metadata or {}
+        
+        # Seuls l'aperçu et la longueur sont conservés : le corps complet n'est
+        # plus référencé une fois cette fonction sortie (pool de threads concurrent)
+        raw_content = scrape_result.raw_content
+        content_length = metadata.get('content_length') or (len(raw_content) if raw_content else 0)
+        if isinstance(raw_content, (bytes, bytearray, memoryview)):
+            # Corps binaire : seul l'aperçu est décodé (4 octets max par caractère UTF-8)
+            raw_content_preview = bytes(raw_content[:RAW_CONTENT_PREVIEW_CHARS * 4]).decode(
+                'utf-8', errors='replace'
+            )[:RAW_CONTENT_PREVIEW_CHARS]
+        else:
+            raw_content_preview = (raw_content or "")[:RAW_CONTENT_PREVIEW_CHARS]
+        del raw_content, scrape_result
+        
+        # Récupération sécurisée de la stratégie
+        coordinator_meta = metadata.get('smart_coordinator', {})
+        strategy_used = coordinator_meta.get('strategy_used', 'intelligent')
+        
+        # CORRECTION: Validation de la stratégie
+        if strategy_used not in VALID_STRATEGIES:
+            strategy_used = 'intelligent'
+        
+        # Compteurs et indicateurs de qualité en un passage
+        extraction_count, structured_fields, has_llm_analysis = _summarize(structured_data, metadata)
+        
+        logger.debug("📊 Extracted %d values using %s strategy", extraction_count, strategy_used)
+        
+        # Construction du résultat enrichi
+        result_dict = _SUCCESS_RESULT_SHELL.copy()
+        result_dict["url"] = url
+        result_dict["content"] = {
+            "raw_content": raw_content_preview,
+            "structured_data": structured_data,
+            "metadata": metadata
+        }
+        result_dict["strategy_used"] = strategy_used
+        result_dict["method"] = _STRATEGY_METHODS[strategy_used]
+        result_dict["llm_analysis"] = metadata.get('llm_analysis', {})
+        result_dict["processing_time"] = url_processing_time
+        result_dict["timestamp"] = now_iso
+        result_dict["confidence_score"] = metadata.get('compliance_score', 0.8)
+        result_dict["extraction_count"] = extraction_count
+        result_dict["quality_metrics"] = {
+            "content_length": content_length,
+            "structured_data_fields": structured_fields,
+            "has_llm_analysis": has_llm_analysis,
+            "intelligence_level": metadata.get('intelligence_level', 'enhanced_automatic')
+        }
+        
+        logger.info("✅ URL processed: %s (%s, %d values)", url, strategy_used, extraction_count)
+        return result_dict, strategy_used
+        
+    except Exception as result_error:
+        logger.error("❌ Result processing failed for %s: %s", url, result_error)
+        return {
+            "url": url,
+            "success": False,
+            "status_code": 500,
+            "error": f"Result processing error: {str(result_error)}",
+            "strategy_used": "error",
+            "method": "processing_failed",
+            "timestamp": now_iso
+        }, None
+
 def register_tasks():
     """Enregistre les tâches Celery CORRIGÉES avec timeouts sécurisés"""
     celery_app = get_celery_app()
     
     @celery_app.task(bind=True, name='app.tasks.scraping_tasks.smart_scraping_task',
-                     soft_time_limit=540, time_limit=600)  # CORRECTION: Timeouts explicites
+                     soft_time_limit=540, time_limit=SMART_TASK_TIME_LIMIT,  # CORRECTION: Timeouts explicites
+                     autoretry_for=(Exception,),
+                     dont_autoretry_for=(TimeoutError, SoftTimeLimitExceeded),
+                     retry_backoff=30, retry_backoff_max=300, retry_jitter=True,
+                     max_retries=2)
     def smart_scraping_task(
         self, 
         task_id: str, 
@@ -88,241 +545,218 @@ def register_tasks():
         quality_threshold: float = 0.1,  # CORRIGÉ: Seuil très permissif
         timeout: int = 60,
         callback_url: Optional[str] = None,
-        priority: int = 1
+        priority: int = 1,
+        concurrency: Optional[int] = None
     ):
         """Tâche de scraping intelligent CORRIGÉE avec timeouts sécurisés"""
         start_time = datetime.utcnow()
+        start_mono = time.monotonic()
         
         # CORRECTION CRITIQUE: Protection timeout globale
-        max_task_timeout = min(timeout * len(urls), 500)  # Max 8min 20s
+        total_urls = len(urls)
+        max_task_timeout = min(timeout * total_urls, 500)  # Max 8min 20s
         
         logger.info(f"🚀 CORRECTED smart scraping task started: {task_id}")
-        logger.info(f"URLs: {len(urls)}, LLM: {'Enabled' if enable_llm_analysis else 'Auto'}")
+        logger.info(f"URLs: {total_urls}, LLM: {'Enabled' if enable_llm_analysis else 'Auto'}")
         logger.info(f"Task timeout protection: {max_task_timeout}s")
         
         try:
-            with TimeoutHandler(max_task_timeout):
-                # Initialisation du progress avec protection DB
+            with TimeoutHandler(max_task_timeout) as task_budget:
+                # Prise en charge atomique de la tâche (initialisation du progress incluse)
+                claimed = True
                 try:
-                    with get_db_session() as db:
-                        progress_data = {
-                            "current": 0, 
-                            "total": len(urls), 
-                            "percentage": 0.0, 
-                            "display": f"0/{len(urls)}"
-                        }
-                        
-                        db.execute(
-                            update(ScrapingTask)
-                            .where(ScrapingTask.task_id == task_id)
-                            .values(
-                                status="running", 
-                                started_at=start_time, 
-                                progress=progress_data,
-                                worker_id=self.request.id
-                            )
-                        )
-                        db.commit()
+                    progress_data = {
+                        "current": 0, 
+                        "total": total_urls, 
+                        "percentage": 0.0, 
+                        "display": f"0/{total_urls}"
+                    }
+                    
+                    # Limite dure effective : celle passée à apply_async, sinon celle du décorateur
+                    hard_time_limit = (self.request.timelimit or (None, None))[0] or SMART_TASK_TIME_LIMIT
+                    claimed = _claim_task(
+                        task_id,
+                        hard_time_limit,
+                        status="running", 
+                        started_at=start_time, 
+                        progress=progress_data,
+                        results=[],
+                        worker_id=self.request.id
+                    )
+                except SoftTimeLimitExceeded:
+                    raise
                 except Exception as db_error:
                     logger.warning(f"DB update failed: {db_error}")
+                
+                if not claimed:
+                    # Tâche terminée, annulée ou prise par une autre exécution : aucun scraping relancé
+                    logger.warning(f"⏭️ Task {task_id} already claimed, finished or cancelled, skipping")
+                    return {
+                        "task_id": task_id,
+                        "status": "skipped",
+                        "total_urls": total_urls
+                    }
 
                 # CORRECTION CRITIQUE: Création du coordinateur avec gestion d'erreurs
                 try:
-                    coordinator = SmartScrapingCoordinator()
-                    logger.info("✅ Smart coordinator created successfully")
+                    coordinator = _get_coordinator()
+                    logger.info("✅ Smart coordinator ready")
+                except SoftTimeLimitExceeded:
+                    raise
                 except Exception as coord_error:
                     logger.error(f"❌ Failed to create coordinator: {coord_error}")
                     raise Exception(f"Coordinator initialization failed: {coord_error}")
                 
-                results = []
                 successful_urls = 0
                 strategy_stats = {"traditional": 0, "intelligent": 0}
                 
                 # CORRECTION: Limitation intelligente du nombre d'URLs
-                max_urls = min(len(urls), 10)  # Limiter à 10 URLs max
+                max_urls = min(total_urls, 10)  # Limiter à 10 URLs max
                 urls_to_process = urls[:max_urls]
                 
-                if len(urls) > max_urls:
-                    logger.warning(f"⚠️ URLs limited from {len(urls)} to {max_urls} for performance")
+                if total_urls > max_urls:
+                    logger.warning(f"⚠️ URLs limited from {total_urls} to {max_urls} for performance")
+                
+                # Traitement concurrent des URLs (I/O réseau indépendantes)
+                single_url_timeout = min(timeout, 90)  # Max 90s par URL
+                total_to_process = len(urls_to_process)
+                completed_count = 0
+                
+                # Compteur live dans Redis (la progression SQL reste coalescée)
+                start_progress(task_id, total_to_process)
+                
+                # Un emplacement par URL : résultats dans l'ordre des URLs, sans réallocation
+                results: List[Optional[Dict[str, Any]]] = [None] * total_to_process
+                pending_results: List[Dict[str, Any]] = []
+                pending_indexes: List[int] = []
+                appended_indexes = set()  # Résultats déjà ajoutés à la colonne results
+                soft_limit_reached = False
+                last_progress_write = time.monotonic()
+                
+                scrape_fn = _resolve_scrape_fn(
+                    coordinator, enable_llm_analysis, quality_threshold, single_url_timeout
+                )
+                
+                # Budget global : 90% du timeout de la tâche
+                remaining_budget = task_budget.remaining(fraction=0.9)
                 
-                # Traitement avec timeout par URL
-                for i, url in enumerate(urls_to_process):
-                    url_start_time = time.time()
+                # Borne de parallélisme : paramètre de la tâche, plafonné par la configuration worker
+                url_workers = min(concurrency or MAX_URL_WORKERS, MAX_URL_WORKERS)
+                executor = ThreadPoolExecutor(
+                    max_workers=max(min(total_to_process, url_workers), 1),
+                    thread_name_prefix=f"scrape-{task_id[:8]}"
+                )
+                futures = {}
+                try:
+                    futures = {
+                        executor.submit(_scrape_one, scrape_fn, url): (index, url)
+                        for index, url in enumerate(urls_to_process)
+                    }
                     
                     try:
-                        logger.info(f"🎯 Processing URL {i+1}/{len(urls_to_process)}: {url}")
-                        
-                        # CORRECTION CRITIQUE: Timeout par URL
-                        single_url_timeout = min(timeout, 90)  # Max 90s par URL
-                        
-                        # Vérification timeout global
-                        elapsed_total = (datetime.utcnow() - start_time).total_seconds()
-                        if elapsed_total > max_task_timeout * 0.9:  # 90% du timeout
-                            logger.warning(f"⏰ Approaching task timeout, stopping at URL {i+1}")
-                            break
-                        
-                        # CORRECTION: Appel coordinateur avec timeout et validation
-                        scrape_result = None
-                        try:
-                            with TimeoutHandler(single_url_timeout):
-                                # Support LangGraph pour le superviseur
-                                if hasattr(coordinator, 'scrape_with_langgraph'):
-                                    logger.info("Using LangGraph-enabled scraping")
-                                    scrape_result = coordinator.scrape_with_langgraph(
-                                        url=url,
-                                        enable_llm_analysis=enable_llm_analysis
-                                    )      
-                                else:
-                                    logger.info("Using standard coordinator scraping")
-                                    scrape_result = coordinator.scrape(
-                                        url=url,
-                                        enable_llm_analysis=enable_llm_analysis,
-                                        quality_threshold=quality_threshold,
-                                        timeout=single_url_timeout
-                                    )
-                        except TimeoutError as timeout_error:
-                            logger.error(f"⏰ URL timeout: {url} after {single_url_timeout}s")
-                            scrape_result = None
-                        except Exception as scrape_error:
-                            logger.error(f"❌ Scraping error for {url}: {scrape_error}")
-                            scrape_result = None
-                        
-                        url_processing_time = time.time() - url_start_time
-                        
-                        # CORRECTION CRITIQUE: Validation du résultat avec logs détaillés
-                        if scrape_result and hasattr(scrape_result, 'structured_data'):
-                            logger.info(f"✅ Scrape result received for {url}")
-                            
-                            # Extraction sécurisée des données
+                        for future in as_completed(futures, timeout=max(remaining_budget, 1)):
+                            index, url = futures[future]
                             try:
-                                raw_content = scrape_result.raw_content or ""
-                                structured_data = scrape_result.structured_data or {}
-                                metadata = scrape_result.metadata or {}
-                                
-                                # Récupération sécurisée de la stratégie
-                                coordinator_meta = metadata.get('smart_coordinator', {})
-                                strategy_used = coordinator_meta.get('strategy_used', 'intelligent')
-                                
-                                # CORRECTION: Validation de la stratégie
-                                if strategy_used in strategy_stats:
-                                    strategy_stats[strategy_used] += 1
-                                else:
-                                    strategy_stats['intelligent'] += 1
-                                    strategy_used = 'intelligent'
-                                
-                                # Extraction du nombre de valeurs
-                                extracted_values = structured_data.get('extracted_values', {})
-                                extraction_count = len(extracted_values) if isinstance(extracted_values, dict) else 0
-                                
-                                logger.info(f"📊 Extracted {extraction_count} values using {strategy_used} strategy")
-                                
-                                # Construction du résultat enrichi
-                                result_dict = {
-                                    "url": url,
-                                    "success": True,
-                                    "status_code": 200,
-                                    "content": {
-                                        "raw_content": raw_content[:5000] if raw_content else "",
-                                        "structured_data": structured_data,
-                                        "metadata": metadata
-                                    },
-                                    "strategy_used": strategy_used,
-                                    "method": f"corrected_{strategy_used}",
-                                    "llm_analysis": metadata.get('llm_analysis', {}),
-                                    "processing_time": url_processing_time,
-                                    "timestamp": datetime.utcnow().isoformat(),
-                                    "confidence_score": metadata.get('compliance_score', 0.8),
-                                    "extraction_count": extraction_count,
-                                    "quality_metrics": {
-                                        "content_length": len(raw_content),
-                                        "structured_data_fields": len(structured_data) if isinstance(structured_data, dict) else 0,
-                                        "has_llm_analysis": bool(metadata.get('llm_analysis')),
-                                        "intelligence_level": metadata.get('intelligence_level', 'enhanced_automatic')
-                                    },
-                                    "corrections_applied": [
-                                        "timeout_protection",
-                                        "strategy_validation", 
-                                        "robust_error_handling",
-                                        "permissive_thresholds"
-                                    ]
-                                }
-                                
-                                results.append(result_dict)
-                                successful_urls += 1
-                                logger.info(f"✅ URL processed successfully: {url} using {strategy_used}")
-                                
-                            except Exception as result_error:
-                                logger.error(f"❌ Result processing failed for {url}: {result_error}")
-                                error_result = {
+                                result_dict, strategy_used = future.result()
+                            except SoftTimeLimitExceeded:
+                                # Limite atteinte pendant la boucle : traitée avec les URLs non terminées
+                                raise
+                            except Exception as url_error:
+                                logger.error(f"❌ Error processing URL {url}: {str(url_error)}")
+                                result_dict, strategy_used = {
                                     "url": url,
                                     "success": False,
                                     "status_code": 500,
-                                    "error": f"Result processing error: {str(result_error)}",
+                                    "error": str(url_error),
                                     "strategy_used": "error",
-                                    "method": "processing_failed",
+                                    "method": "url_processing_error",
                                     "timestamp": datetime.utcnow().isoformat()
-                                }
-                                results.append(error_result)
-                        else:
-                            logger.warning(f"⚠️ No valid result from coordinator for: {url}")
-                            error_result = {
-                                "url": url,
-                                "success": False,
-                                "status_code": 500,
-                                "error": "Coordinator returned no valid content",
-                                "strategy_used": "failed",
-                                "method": "coordinator_failed",
-                                "timestamp": datetime.utcnow().isoformat()
-                            }
-                            results.append(error_result)
-                        
-                        # Mise à jour du progress avec protection
-                        try:
-                            current_progress = i + 1
-                            percentage = round((current_progress / len(urls_to_process)) * 100, 2)
+                                }, None
                             
-                            progress_data = {
-                                "current": current_progress,
-                                "total": len(urls_to_process),
-                                "percentage": percentage,
-                                "display": f"{current_progress}/{len(urls_to_process)}"
-                            }
+                            result_dict["url_index"] = index
+                            results[index] = result_dict
+                            pending_results.append(result_dict)
+                            pending_indexes.append(index)
+                            if strategy_used is not None:
+                                strategy_stats[strategy_used] += 1
+                                successful_urls += 1
                             
-                            with get_db_session() as db:
-                                db.execute(
-                                    update(ScrapingTask)
-                                    .where(ScrapingTask.task_id == task_id)
-                                    .values(progress=progress_data)
-                                )
-                                db.commit()
-                        except Exception as progress_error:
-                            logger.warning(f"Progress update failed: {progress_error}")
+                            # Mise à jour du progress coalescée (par intervalle ou par lot de résultats)
+                            completed_count += 1
+                            increment_progress(task_id)
+                            now = time.monotonic()
+                            if (now - last_progress_write < PROGRESS_WRITE_INTERVAL
+                                    and len(pending_results) < PROGRESS_FLUSH_EVERY
+                                    and completed_count < total_to_process):
+                                continue
+                            last_progress_write = now
+                            try:
+                                percentage = round((completed_count / total_to_process) * 100, 2)
+                                
+                                progress_data = {
+                                    "current": completed_count,
+                                    "total": total_to_process,
+                                    "percentage": percentage,
+                                    "display": f"{completed_count}/{total_to_process}"
+                                }
+                                
+                                # Résultats visibles au fil de l'eau avec la progression
+                                if _append_task_results(task_id, pending_results, progress_data):
+                                    appended_indexes.update(pending_indexes)
+                                pending_results = []
+                                pending_indexes = []
+                            except SoftTimeLimitExceeded:
+                                raise
+                            except Exception as progress_error:
+                                logger.warning(f"Progress update failed: {progress_error}")
+                    
+                    except (FuturesTimeoutError, SoftTimeLimitExceeded) as budget_error:
+                        # URLs non terminées dans le budget : enregistrées comme timeouts,
+                        # les résultats partiels sont finalisés normalement
+                        soft_limit_reached = isinstance(budget_error, SoftTimeLimitExceeded)
+                        logger.warning(
+                            f"⏰ {'Celery soft time limit reached' if soft_limit_reached else 'Approaching task timeout'}, "
+                            f"{total_to_process - completed_count} URL(s) unfinished"
+                        )
+                        budget_timestamp = datetime.utcnow().isoformat()
+                        for future, (index, url) in futures.items():
+                            if results[index] is not None:
+                                continue
                             
-                    except Exception as url_error:
-                        logger.error(f"❌ Error processing URL {url}: {str(url_error)}")
-                        
-                        error_result = {
-                            "url": url,
-                            "success": False,
-                            "status_code": 500,
-                            "error": str(url_error),
-                            "strategy_used": "error",
-                            "method": "url_processing_error",
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                        results.append(error_result)
+                            # Terminée pendant l'interruption : le résultat est conservé
+                            if future.done() and not future.cancelled() and future.exception() is None:
+                                results[index], strategy_used = future.result()
+                                results[index]["url_index"] = index
+                                if strategy_used is not None:
+                                    strategy_stats[strategy_used] += 1
+                                    successful_urls += 1
+                            else:
+                                future.cancel()
+                                results[index] = {
+                                    "url": url,
+                                    "success": False,
+                                    "status_code": 504,
+                                    "error": f"URL not completed within task budget ({max_task_timeout}s)",
+                                    "strategy_used": "timeout",
+                                    "method": "task_budget_exceeded",
+                                    "timestamp": budget_timestamp,
+                                    "url_index": index
+                                }
+                finally:
+                    # Ne pas bloquer sur les threads encore en cours
+                    executor.shutdown(wait=False, cancel_futures=True)
 
                 # Calcul des métriques finales
-                execution_time = (datetime.utcnow() - start_time).total_seconds()
+                execution_time = time.monotonic() - start_mono
                 
                 # CORRECTION: Métriques robustes
-                success_rate = round((successful_urls / len(urls_to_process)) * 100, 2) if urls_to_process else 0
+                success_rate = round((successful_urls / total_to_process) * 100, 2) if urls_to_process else 0
                 
                 metrics = {
-                    "total_urls": len(urls),
-                    "processed_urls": len(urls_to_process), 
+                    "total_urls": total_urls,
+                    "processed_urls": total_to_process, 
                     "successful_urls": successful_urls,
-                    "failed_urls": len(urls_to_process) - successful_urls,
+                    "failed_urls": total_to_process - successful_urls,
                     "success_rate": success_rate,
                     "execution_time": round(execution_time, 2),
                     "analysis_type": "corrected_smart_automatic",
@@ -331,50 +765,62 @@ def register_tasks():
                     "strategy_distribution": strategy_stats,
                     "corrections_metadata": {
                         "timeout_protection_applied": True,
-                        "url_limiting_applied": len(urls) > len(urls_to_process),
+                        "url_limiting_applied": total_urls > total_to_process,
                         "permissive_validation": True,
                         "robust_error_handling": True,
-                        "max_task_timeout": max_task_timeout
+                        "max_task_timeout": max_task_timeout,
+                        "soft_time_limit_reached": soft_limit_reached
                     }
                 }
 
                 # Finalisation avec protection DB
                 final_progress = {
-                    "current": len(urls_to_process),
-                    "total": len(urls_to_process),
+                    "current": total_to_process,
+                    "total": total_to_process,
                     "percentage": 100.0,
-                    "display": f"{len(urls_to_process)}/{len(urls_to_process)}"
+                    "display": f"{total_to_process}/{total_to_process}"
                 }
 
+                finalized = True
                 try:
-                    with get_db_session() as db:
-                        db.execute(
-                            update(ScrapingTask)
-                            .where(ScrapingTask.task_id == task_id)
-                            .values(
-                                status="completed",
-                                completed_at=datetime.utcnow(),
-                                results=results,
-                                progress=final_progress,
-                                metrics=metrics
-                            )
-                        )
-                        db.commit()
+                    finalized = _finalize_task(
+                        task_id,
+                        [result for index, result in enumerate(results) if index not in appended_indexes],
+                        status="completed",
+                        # Horloge murale dérivée du chronomètre monotone (cohérente avec execution_time)
+                        completed_at=start_time + timedelta(seconds=execution_time),
+                        progress=final_progress,
+                        metrics=metrics
+                    )
+                except SoftTimeLimitExceeded:
+                    raise
                 except Exception as final_db_error:
                     logger.error(f"Final DB update failed: {final_db_error}")
+                finish_progress(task_id)
+                
+                if not finalized:
+                    # Statut modifié pendant l'exécution (annulation via l'API) : résultats écartés
+                    logger.warning(f"🛑 Task {task_id} no longer running, results discarded")
+                    return {
+                        "task_id": task_id,
+                        "status": "cancelled",
+                        "metrics": metrics,
+                        "execution_time": execution_time
+                    }
                     
                 logger.info(f"🎉 CORRECTED smart scraping completed: {task_id}")
-                logger.info(f"Success rate: {success_rate}% ({successful_urls}/{len(urls_to_process)})")
+                logger.info(f"Success rate: {success_rate}% ({successful_urls}/{total_to_process})")
                 logger.info(f"Strategy distribution: {strategy_stats}")
                 logger.info(f"Execution time: {execution_time:.2f}s")
                 
-                return make_json_serializable({
+                # Valeurs déjà primitives : pas de parcours de conversion avant la sérialisation Celery
+                return {
                     "task_id": task_id,
                     "status": "completed",
                     "metrics": metrics,
                     "successful_urls": successful_urls,
-                    "total_urls": len(urls),
-                    "processed_urls": len(urls_to_process),
+                    "total_urls": total_urls,
+                    "processed_urls": total_to_process,
                     "execution_time": execution_time,
                     "coordinator_mode": "corrected_smart_automatic",
                     "corrections_applied": [
@@ -384,26 +830,14 @@ def register_tasks():
                         "robust_error_handling",
                         "permissive_validation"
                     ]
-                })
+                }
                 
-        except TimeoutError as timeout_error:
-            error_msg = f"Task timed out: {str(timeout_error)}"
+        except (TimeoutError, SoftTimeLimitExceeded) as timeout_error:
+            # Limite atteinte hors de la boucle d'URLs : pas de retry, la tâche est marquée timeout
+            error_msg = f"Task timed out: {str(timeout_error) or type(timeout_error).__name__}"
             logger.error(f"⏰ TIMEOUT: {task_id} - {error_msg}")
             
-            try:
-                with get_db_session() as db:
-                    db.execute(
-                        update(ScrapingTask)
-                        .where(ScrapingTask.task_id == task_id)
-                        .values(
-                            status="timeout",
-                            completed_at=datetime.utcnow(),
-                            error=error_msg
-                        )
-                    )
-                    db.commit()
-            except Exception as db_error:
-                logger.error(f"Failed to update DB after timeout: {db_error}")
+            _record_task_failure(task_id, "timeout", error_msg)
             
             raise timeout_error
             
@@ -412,57 +846,154 @@ def register_tasks():
             logger.error(f"❌ Task failed: {task_id} - {error_msg}")
             logger.error(f"Traceback: {traceback.format_exc()}")
             
-            try:
-                with get_db_session() as db:
-                    db.execute(
-                        update(ScrapingTask)
-                        .where(ScrapingTask.task_id == task_id)
-                        .values(
-                            status="failed",
-                            completed_at=datetime.utcnow(),
-                            error=error_msg
-                        )
-                    )
-                    db.commit()
-            except Exception as db_error:
-                logger.error(f"Failed to update DB: {db_error}")
+            _record_task_failure(task_id, "failed", error_msg)
             
-            # CORRECTION: Retry intelligent avec backoff
-            if self.request.retries < 2:  # Réduit à 2 tentatives max
-                countdown = 30 * (2 ** self.request.retries)  # Backoff plus court
-                logger.info(f"🔄 Retrying task {task_id} in {countdown}s (attempt {self.request.retries + 1}/2)")
-                raise self.retry(exc=e, countdown=countdown, max_retries=2)
-            else:
+            # Retry délégué à Celery (autoretry_for + backoff exponentiel avec jitter)
+            if self.request.retries >= self.max_retries:
                 logger.error(f"❌ Task {task_id} failed after all retries")
-                raise e
+            raise
+
+    @celery_app.task(bind=True, name='app.tasks.scraping_tasks.scrape_url_task',
+                     soft_time_limit=120, time_limit=150)
+    def scrape_url_task(
+        self,
+        url: str,
+        enable_llm_analysis: bool = False,
+        quality_threshold: float = 0.1,
+        timeout: int = 60,
+        progress_task_id: Optional[str] = None
+    ):
+        """Scraping d'une seule URL (en-tête d'un chord, réparti sur tous les workers)"""
+        try:
+            scrape_fn = _resolve_scrape_fn(
+                _get_coordinator(), enable_llm_analysis, quality_threshold, min(timeout, 90)
+            )
+            result_dict, _ = _scrape_one(scrape_fn, url)
+        except SoftTimeLimitExceeded:
+            result_dict = {
+                "url": url,
+                "success": False,
+                "status_code": 504,
+                "error": "URL not completed within soft time limit",
+                "strategy_used": "timeout",
+                "method": "task_budget_exceeded",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        except Exception as url_error:
+            # Une URL en échec ne doit pas faire échouer le chord entier
+            logger.error(f"❌ Error processing URL {url}: {url_error}")
+            result_dict = {
+                "url": url,
+                "success": False,
+                "status_code": 500,
+                "error": str(url_error),
+                "strategy_used": "error",
+                "method": "url_processing_error",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        
+        if progress_task_id:
+            increment_progress(progress_task_id)
+        
+        # Le contenu structuré peut contenir des types non JSON (transit par le backend de résultats)
+        return make_json_serializable(result_dict)
+
+    @celery_app.task(bind=True, name='app.tasks.scraping_tasks.finalize_scraping_task',
+                     soft_time_limit=60, time_limit=90)
+    def finalize_scraping_task(
+        self,
+        url_results: List[Dict[str, Any]],
+        task_id: str,
+        total_urls: int,
+        started_epoch: float,
+        enable_llm_analysis: bool = False
+    ):
+        """Callback du chord : agrège les résultats par URL et finalise la tâche"""
+        total_to_process = len(url_results)
+        strategy_stats = {strategy: 0 for strategy in VALID_STRATEGIES}
+        # Résultats du chord dans l'ordre des URLs du groupe
+        for index, result in enumerate(url_results):
+            result["url_index"] = index
+            if result.get("success") and result.get("strategy_used") in strategy_stats:
+                strategy_stats[result["strategy_used"]] += 1
+        successful_urls = sum(strategy_stats.values())
+        
+        # Horloge murale : le chord s'exécute sur plusieurs processus
+        execution_time = max(time.time() - started_epoch, 0.0)
+        success_rate = round((successful_urls / total_to_process) * 100, 2) if total_to_process else 0
+        
+        metrics = {
+            "total_urls": total_urls,
+            "processed_urls": total_to_process,
+            "successful_urls": successful_urls,
+            "failed_urls": total_to_process - successful_urls,
+            "success_rate": success_rate,
+            "execution_time": round(execution_time, 2),
+            "analysis_type": "corrected_smart_automatic",
+            "llm_analysis_enabled": enable_llm_analysis,
+            "coordinator_mode": "chord_distributed",
+            "strategy_distribution": strategy_stats
+        }
+        
+        finalized = _finalize_task(
+            task_id,
+            url_results,
+            status="completed",
+            completed_at=datetime.utcnow(),
+            progress={
+                "current": total_to_process,
+                "total": total_to_process,
+                "percentage": 100.0,
+                "display": f"{total_to_process}/{total_to_process}"
+            },
+            metrics=metrics
+        )
+        
+        finish_progress(task_id)
+        logger.info(f"🎉 Chord scraping {'completed' if finalized else 'discarded'}: {task_id} "
+                    f"({successful_urls}/{total_to_process})")
+        return {
+            "task_id": task_id,
+            "status": "completed" if finalized else "cancelled",
+            "metrics": metrics
+        }
+
+    @celery_app.task(name='app.tasks.scraping_tasks.scraping_chord_error_task')
+    def scraping_chord_error_task(request, exc, traceback, task_id: str):
+        """Errback du chord (en-tête ou finalisation en échec) : la tâche passe en 'failed'"""
+        error_msg = f"Chord scraping failed: {exc!r}"
+        logger.error(f"❌ Task failed: {task_id} - {error_msg}")
+        _record_task_failure(task_id, "failed", error_msg)
+
+    @celery_app.task(bind=True, name='app.tasks.scraping_tasks.cleanup_old_tasks_task',
+                     soft_time_limit=600, time_limit=660)
+    def cleanup_old_tasks_task(self, older_than_days: int = TASK_RETENTION_DAYS):
+        """Purge périodique des tâches terminées anciennes (planifiée par celery beat)"""
+        return cleanup_old_tasks(older_than_days)
 
     @celery_app.task(bind=True, name='app.tasks.scraping_tasks.health_check_task',
                      soft_time_limit=30, time_limit=45)  # CORRECTION: Timeouts courts
     def health_check_task(self):
         """Tâche de vérification de santé CORRIGÉE avec timeout"""
         try:
-            check_start = datetime.utcnow()
+            check_start = time.monotonic()
             
-            with TimeoutHandler(40):  # Protection timeout
+            with TimeoutHandler(40) as check_budget:  # Protection timeout
                 # Test du coordinateur intelligent
-                coordinator = SmartScrapingCoordinator()
-                coordinator_status = coordinator.get_coordinator_status()
+                coordinator_status = run_with_timeout(
+                    _load_coordinator_status, check_budget.remaining()
+                )
                 
                 # Test de la base de données avec timeout
                 try:
-                    with get_db_session() as db:
-                        total_tasks = db.execute("SELECT COUNT(*) FROM scraping_tasks").scalar()
-                        active_tasks = db.execute(
-                            "SELECT COUNT(*) FROM scraping_tasks WHERE status IN ('pending', 'running')"
-                        ).scalar()
-                        recent_tasks = db.execute(
-                            "SELECT COUNT(*) FROM scraping_tasks WHERE created_at >= CURRENT_DATE"
-                        ).scalar()
+                    total_tasks, active_tasks, recent_tasks = run_with_timeout(
+                        _count_scraping_tasks, check_budget.remaining()
+                    )
                 except Exception as db_error:
                     logger.error(f"DB health check failed: {db_error}")
                     total_tasks = active_tasks = recent_tasks = -1
                 
-                check_time = (datetime.utcnow() - check_start).total_seconds()
+                check_time = time.monotonic() - check_start
                 
                 return {
                     "status": "healthy",
@@ -506,17 +1037,17 @@ def register_tasks():
     def coordinator_status_task(self):
         """Tâche de statut du coordinateur CORRIGÉE"""
         try:
-            with TimeoutHandler(25):  # Protection timeout
-                coordinator = SmartScrapingCoordinator()
-                status = coordinator.get_coordinator_status()
+            with TimeoutHandler(25) as status_budget:  # Protection timeout
+                status = run_with_timeout(_load_coordinator_status, status_budget.remaining())
                 
-                return make_json_serializable({
+                # Seul le statut du coordinateur peut contenir des types non JSON
+                return {
                     "timestamp": datetime.utcnow().isoformat(),
-                    "coordinator_status": status,
+                    "coordinator_status": make_json_serializable(status),
                     "task_id": self.request.id,
                     "intelligence_mode": "corrected_automatic",
                     "timeout_protection": True
-                })
+                }
                 
         except Exception as e:
             logger.error(f"Coordinator status check failed: {e}")
@@ -536,7 +1067,7 @@ def register_tasks():
                     "https://restcountries.com/v3.1/name/tunisia"
                 ]
             
-            coordinator = SmartScrapingCoordinator()
+            coordinator = _get_coordinator()
             results = {}
             
             for url in test_urls:
@@ -582,22 +1113,69 @@ def register_tasks():
                 "error": str(e)
             }
 
-    return smart_scraping_task, health_check_task, coordinator_status_task, test_langgraph_workflow
+    return (smart_scraping_task, scrape_url_task, finalize_scraping_task, scraping_chord_error_task,
+            cleanup_old_tasks_task, health_check_task, coordinator_status_task, test_langgraph_workflow)
 
 # Export pour utilisation externe
 if __name__ != '__main__':
     try:
-        smart_scraping_task, health_check_task, coordinator_status_task, test_langgraph_workflow = register_tasks()
+        (smart_scraping_task, scrape_url_task, finalize_scraping_task, scraping_chord_error_task,
+         cleanup_old_tasks_task, health_check_task, coordinator_status_task,
+         test_langgraph_workflow) = register_tasks()
         logger.info("CORRECTED smart scraping tasks registered successfully")
     except Exception as e:
         logger.error(f"Task registration failed: {e}")
 
+def dispatch_scraping_chord(
+    task_id: str,
+    urls: List[str],
+    enable_llm_analysis: bool = False,
+    quality_threshold: float = 0.1,
+    timeout: int = 60
+):
+    """Répartit les URLs d'une tâche en chord : une sous-tâche par URL, puis finalisation.
+    
+    Utilisé par POST /tasks à partir de settings.CHORD_URL_THRESHOLD URLs : le débit
+    suit le nombre de workers du cluster et l'échec d'une URL n'interrompt pas le lot. Si le chord
+    échoue malgré tout (finalisation, worker perdu), scraping_chord_error_task marque
+    la tâche 'failed'.
+    """
+    total_urls = len(urls)
+    _update_task(
+        task_id,
+        status="running",
+        started_at=datetime.utcnow(),
+        progress={"current": 0, "total": total_urls, "percentage": 0.0, "display": f"0/{total_urls}"},
+        results=[]
+    )
+    start_progress(task_id, total_urls)
+    
+    header = group(
+        scrape_url_task.s(url, enable_llm_analysis, quality_threshold, timeout, progress_task_id=task_id)
+        for url in urls
+    )
+    callback = finalize_scraping_task.s(
+        task_id=task_id,
+        total_urls=total_urls,
+        started_epoch=time.time(),
+        enable_llm_analysis=enable_llm_analysis
+    )
+    # Errback du corps : appelé aussi quand une tâche de l'en-tête échoue
+    callback.link_error(scraping_chord_error_task.s(task_id=task_id))
+    return chord(header)(callback)
+
 __all__ = [
     'register_tasks', 
     'smart_scraping_task', 
+    'scrape_url_task',
+    'finalize_scraping_task',
+    'scraping_chord_error_task',
+    'cleanup_old_tasks_task',
+    'dispatch_scraping_chord',
     'health_check_task', 
     'coordinator_status_task',
     'test_langgraph_workflow',  # AJOUTÉ
     'make_json_serializable',
-    'TimeoutHandler'
+    'TimeoutHandler',
+    'run_with_timeout'
 ]
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+Compteur de progression des tâches dans Redis
+Incrément en mémoire par URL ; la progression JSON n'est écrite en base que par intervalles
+Les erreurs Redis sont ignorées, jamais la limite souple Celery (SoftTimeLimitExceeded)
+"""
+
+import os
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+from celery.exceptions import SoftTimeLimitExceeded
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Durée de conservation du compteur après la fin de la tâche (secondes)
+PROGRESS_KEY_TTL = 3600
+
+_client = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+def _progress_key(task_id: str) -> str:
+    return f"progress:{task_id}"
+
+def _get_redis():
+    """Client Redis par processus (recréé après un fork), None si indisponible"""
+    global _client, _client_pid
+
+    if not REDIS_AVAILABLE:
+        return None
+
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:
+                redis_url = os.getenv('REDIS_URL', 'redis://redis:6379/0')
+                _client = redis.Redis.from_url(redis_url, socket_timeout=2, socket_connect_timeout=2)
+                _client_pid = pid
+    return _client
+
+def start_progress(task_id: str, total: int):
+    """Initialise le compteur (done=0) de la tâche"""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        key = _progress_key(task_id)
+        with client.pipeline() as pipe:
+            pipe.hset(key, mapping={'total': total, 'done': 0})
+            pipe.expire(key, PROGRESS_KEY_TTL * 24)
+            pipe.execute()
+    except SoftTimeLimitExceeded:
+        raise
+    except Exception as e:
+        logger.debug(f"Redis progress init skipped for {task_id}: {e}")
+
+def increment_progress(task_id: str) -> Optional[int]:
+    """Incrémente le nombre d'URLs terminées ; retourne la nouvelle valeur"""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        return client.hincrby(_progress_key(task_id), 'done', 1)
+    except SoftTimeLimitExceeded:
+        raise
+    except Exception as e:
+        logger.debug(f"Redis progress increment skipped for {task_id}: {e}")
+        return None
+
+def finish_progress(task_id: str):
+    """Fin de tâche : le compteur expire après PROGRESS_KEY_TTL"""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        client.expire(_progress_key(task_id), PROGRESS_KEY_TTL)
+    except SoftTimeLimitExceeded:
+        raise
+    except Exception as e:
+        logger.debug(f"Redis progress expiry skipped for {task_id}: {e}")
+
+def get_progress(task_id: str) -> Optional[Dict[str, Any]]:
+    """Progression au format de la colonne progress, None si le compteur est absent"""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        raw = client.hgetall(_progress_key(task_id))
+    except SoftTimeLimitExceeded:
+        raise
+    except Exception as e:
+        logger.debug(f"Redis progress read failed for {task_id}: {e}")
+        return None
+
+    if not raw:
+        return None
+
+    total = int(raw.get(b'total', 0)) or 1
+    current = min(int(raw.get(b'done', 0)), total)
+    return {
+        "current": current,
+        "total": total,
+        "percentage": round(current / total * 100, 2),
+        "display": f"{current}/{total}"
+    }
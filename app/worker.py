@@ -17,6 +17,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Concurrence par défaut du worker (même variable que celery_app.worker_concurrency)
+DEFAULT_WORKER_CONCURRENCY = int(os.getenv('CELERY_WORKER_CONCURRENCY', '8'))
+
 def wait_for_services(max_retries: int = 30) -> bool:
     """Attendre que les services soient prêts"""
     logger.info("⏳ Attente des services...")
@@ -135,7 +138,8 @@ def run_basic_diagnostics() -> Dict[str, Any]:
         diagnostics['error'] = str(e)
         return diagnostics
 
-def start_celery_worker(concurrency: int = 1, loglevel: str = 'info') -> None:
+def start_celery_worker(concurrency: int = DEFAULT_WORKER_CONCURRENCY, loglevel: str = 'info',
+                        queues: str = 'scraping,testing,celery') -> None:
     """Démarrer le worker Celery"""
     logger.info("🔧 Démarrage du worker Celery...")
     
@@ -148,7 +152,7 @@ def start_celery_worker(concurrency: int = 1, loglevel: str = 'info') -> None:
             'worker',
             f'--concurrency={concurrency}',
             f'--loglevel={loglevel}',
-            '--queues=scraping,monitoring,testing',
+            f'--queues={queues}',
             '--pool=solo' if os.name == 'nt' else '--pool=prefork',  # Windows compatibility
         ]
         
@@ -166,8 +170,10 @@ def start_celery_worker(concurrency: int = 1, loglevel: str = 'info') -> None:
 def main():
     """Point d'entrée principal"""
     parser = argparse.ArgumentParser(description='Worker Celery intelligent')
-    parser.add_argument('--concurrency', type=int, default=1, help='Nombre de processus worker')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_WORKER_CONCURRENCY, help='Nombre de processus worker')
     parser.add_argument('--loglevel', default='info', choices=['debug', 'info', 'warning', 'error'])
+    parser.add_argument('--queues', default='scraping,testing,celery',
+                        help='Queues consommées (ex: diagnostics pour un worker dédié)')
     parser.add_argument('--skip-diagnostics', action='store_true', help='Ignorer les diagnostics')
     parser.add_argument('--skip-wait', action='store_true', help='Ignorer l\'attente des services')
     
@@ -189,7 +195,8 @@ def main():
         # 3. Démarrer le worker
         start_celery_worker(
             concurrency=args.concurrency,
-            loglevel=args.loglevel
+            loglevel=args.loglevel,
+            queues=args.queues
         )
         
     except Exception as e:
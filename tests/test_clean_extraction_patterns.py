@@ -0,0 +1,177 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("bs4")
+
+from app.utils import clean_extraction_patterns
+from app.utils.clean_extraction_patterns import CleanExtractionPatterns, _html_to_text
+
+NOISY_PAGE = """<html><body>
+<nav><ul><li>Inflation: 5,2 % 2023</li></ul></nav>
+<div class="ads"><table>
+<tr><th>Indicateur</th><th>2023</th></tr>
+<tr><td>PIB croissance</td><td>4,5</td></tr>
+</table></div>
+<header>Taux d'inflation : 6,1 % en 2023</header>
+<ul><li>Taux de chômage: 16,4 % 2023</li></ul>
+</body></html>"""
+
+NOISE_FREE_KEYS = ['list_0_0', 'text_1_0']
+
+
+@pytest.fixture
+def extractor():
+    return CleanExtractionPatterns()
+
+
+def test_noise_containers_are_not_extracted(extractor, monkeypatch):
+    """Les listes et tableaux dans nav / class="ads" ne sont pas extraits (parcours BS4)"""
+    monkeypatch.setattr(clean_extraction_patterns, '_VECTORIZED_TABLES', False)
+    values = extractor.extract_clean_values_from_html(NOISY_PAGE, 'https://example.com/stats')
+    assert sorted(values) == NOISE_FREE_KEYS
+
+
+def test_free_text_skips_noise_elements():
+    """Le texte de nav/header ne parvient pas aux patterns de texte libre"""
+    text = _html_to_text(NOISY_PAGE)
+    assert 'Taux de chômage' in text
+    assert '5,2' not in text
+    assert '6,1' not in text
+    assert '4,5' not in text
+
+
+def test_free_text_without_lxml(monkeypatch):
+    """Repli BeautifulSoup (html.parser) : mêmes éléments parasites retirés"""
+    monkeypatch.setattr(clean_extraction_patterns, 'LXML_AVAILABLE', False)
+    text = _html_to_text(NOISY_PAGE)
+    assert 'Taux de chômage' in text
+    assert '5,2' not in text
+    assert '6,1' not in text
+
+
+HEADERLESS_TABLE = """<table>
+<tr><td>PIB 2023</td><td>45,2</td></tr>
+<tr><td>Inflation 2022</td><td>8,3</td></tr>
+</table>"""
+
+THEAD_TABLE = """<table>
+<thead><tr><th>Indicateur</th><th>2022</th><th></th><th>2023</th></tr></thead>
+<tbody>
+<tr><td>Taux d'inflation</td><td>8,3 %</td><td>n.d.</td><td>9,3 %</td></tr>
+<tr><td>Croissance du PIB</td><td>2,4</td><td>-</td><td>0,4</td></tr>
+</tbody>
+</table>"""
+
+SPANNED_TABLE = """<table>
+<tr><th rowspan="2">Indicateur</th><th colspan="2">Trimestres</th><th>2023</th></tr>
+<tr><th>T1 2022</th><th>T2 2022</th><th>Annuel</th></tr>
+<tr><td rowspan="2">Taux d'inflation</td><td>8,1</td><td>8,3</td><td>9,3</td></tr>
+<tr><td>7,9</td><td>8,0</td><td>9,1</td></tr>
+<tr><td>Croissance du PIB</td><td colspan="2">2,4</td><td>0,4</td></tr>
+</table>"""
+
+
+def _table_values(extractor, page, vectorized):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page, clean_extraction_patterns._BS4_PARSER,
+                         parse_only=clean_extraction_patterns._STRUCTURE_STRAINER)
+    extractor._remove_noise_elements(soup)
+    if vectorized:
+        values = extractor._extract_from_tables_vectorized(soup, 'https://example.com/stats')
+    else:
+        values = extractor._extract_from_tables_clean_safe(soup, 'https://example.com/stats')
+    return {key: (value['value'], value['year'], value['indicator_name']) for key, value in values.items()}
+
+
+@pytest.mark.parametrize('page', [HEADERLESS_TABLE, THEAD_TABLE, SPANNED_TABLE, NOISY_PAGE])
+def test_vectorized_tables_match_bs4(extractor, page):
+    """Parcours pandas et parcours BS4 : mêmes clés, valeurs et années"""
+    pytest.importorskip("pandas")
+    pytest.importorskip("lxml")
+    assert _table_values(extractor, page, vectorized=True) == _table_values(extractor, page, vectorized=False)
+
+
+def test_headerless_table_uses_first_row_as_header(extractor):
+    """Sans <thead>, la première ligne sert d'en-tête : une seule valeur, année 2023"""
+    pytest.importorskip("pandas")
+    pytest.importorskip("lxml")
+    values = _table_values(extractor, HEADERLESS_TABLE, vectorized=True)
+    assert list(values.values()) == [(8.3, 2023, 'Inflation 2022')]
+
+
+def test_government_scan_matches_nbsp(extractor):
+    """Espace insécable avant % : valeur gouvernementale 7.5 (str comme octets)"""
+    for content in ('<p>inflation : 7,5\xa0%</p>', '<p>inflation : 7,5\xa0%</p>'.encode('utf-8')):
+        values = extractor._extract_tunisian_government_data(content, 'http://www.ins.tn/statistiques')
+        assert values['gov_5_0']['value'] == 7.5
+        assert values['gov_5_0']['unit'] == '%'
+
+
+@pytest.mark.parametrize('text', [
+    'Inflation : 7,5\xa0% en 2023',
+    'Déficit\xa0: 5,4 et Chômage : 15,2 %',
+    'é12,5 %é et 12,5 %x et «\xa012,5\xa0%\xa0»',
+    'taux 3,25 %, PIB = 45,2 et "1.234,5"',
+])
+def test_utf8_patterns_match_str_patterns(extractor, text):
+    """Balayage des octets : mêmes groupes que les patterns str avec IGNORECASE"""
+    import re
+
+    data = text.encode('utf-8').lower()
+    for pattern, compiled in zip(extractor.gov_patterns, extractor._gov_res):
+        expected = [m.group(1) for m in re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)]
+        found = [m.group(1).decode('utf-8') for m in compiled.finditer(data)]
+        assert found == expected, pattern
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('12,5', 12.5),
+    ('1.234,56', 1234.56),
+    ('1,234.56', 1234.56),
+    ('1,2,3', None),
+    ('2020', None),
+    ('12,5\xa0%', 12.5),
+    ('1 234,5', 1234.5),
+    ('-3,5', -3.5),
+    ('abc', None),
+])
+def test_decimal_separator_matrix(extractor, text, expected):
+    """Virgule/point décimal et séparateurs de milliers (table _DECIMAL_TABLES)"""
+    assert extractor._extract_clean_number_safe(text) == expected
+
+
+@pytest.mark.parametrize('value_text, indicator, expected', [
+    ('12 %', 'Taux', '%'),
+    ('45 MD', 'PIB', 'MD'),
+    ('2 millions de dinars', '', 'MD'),
+    ('3 milliards', '', 'Milliards'),
+    ('3 millions', '', 'Millions'),
+    ('9 USD', '', 'USD'),
+    ('9 euros', '', 'EUR'),
+    ('12 % en millions', '', '%'),
+    ('5', 'Population active', 'Habitants'),
+    ('7', 'Taux de chômage', '%'),
+    ('8', 'Dette publique', 'MD'),
+    ('8', 'Autre', ''),
+])
+def test_unit_alternation(extractor, value_text, indicator, expected):
+    """Unité : groupe nommé le plus prioritaire de la valeur, sinon mots-clés de l'indicateur"""
+    assert extractor._determine_unit_from_context_safe(value_text, indicator) == expected
+
+
+@pytest.mark.parametrize('indicator, expected', [
+    ('PIB par habitant', 'FISCAL'),
+    ('Indice des prix', 'MONETARY'),
+    ('Taux de chomage', 'DEMOGRAPHIC'),
+    ('Exportations', 'TRADE'),
+    ("Prix à l'export", 'MONETARY'),
+    ('Exportations et PIB', 'FISCAL'),
+    ('Autre', 'ECONOMIC_GENERAL'),
+])
+def test_category_alternation(extractor, indicator, expected):
+    """Catégorie : mot-clé de la catégorie la plus prioritaire, quel que soit son rang dans le texte"""
+    assert extractor._categorize_indicator_safe(indicator) == expected
@@ -0,0 +1,216 @@
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("celery")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import database
+from app.models.database import Base, ScrapingTask
+from app.tasks import scraping_tasks
+
+
+@pytest.fixture
+def task_db(monkeypatch):
+    """Base SQLite en mémoire branchée sur la session des tâches (compteur Redis désactivé)"""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = scoped_session(sessionmaker(bind=engine, autoflush=False, expire_on_commit=False))
+    monkeypatch.setattr(scraping_tasks, "TaskSession", session)
+    monkeypatch.setattr(database, "SessionLocal", session)
+    monkeypatch.setattr(scraping_tasks, "start_progress", lambda task_id, total: None)
+    monkeypatch.setattr(scraping_tasks, "increment_progress", lambda task_id: None)
+    monkeypatch.setattr(scraping_tasks, "finish_progress", lambda task_id: None)
+    yield session
+    session.remove()
+    engine.dispose()
+
+
+def _add_task(session, task_id, **values):
+    session.add(ScrapingTask(task_id=task_id, urls=[], **values))
+    session.commit()
+
+
+def _get_task(session, task_id):
+    session.expire_all()
+    return session.query(ScrapingTask).filter_by(task_id=task_id).one()
+
+
+def test_finalize_writes_results_without_postgres(task_db):
+    """Hors PostgreSQL : rien n'est ajouté en cours de tâche, la finalisation écrit tous les résultats"""
+    _add_task(task_db, "t-sqlite", status="running", results=[])
+    items = [{"url": "https://b.tn", "url_index": 1}, {"url": "https://a.tn", "url_index": 0}]
+
+    assert scraping_tasks._append_task_results("t-sqlite", items, {"current": 2, "total": 2}) is False
+    assert scraping_tasks._finalize_task("t-sqlite", items, status="completed") is True
+
+    task = _get_task(task_db, "t-sqlite")
+    assert task.status == "completed"
+    assert task.progress == {"current": 2, "total": 2}
+    assert task.results == items
+
+
+def test_finalize_skips_cancelled_task(task_db):
+    """Tâche annulée pendant l'exécution : ni statut ni résultats écrits"""
+    _add_task(task_db, "t-cancelled", status="cancelled", results=[])
+
+    assert scraping_tasks._finalize_task("t-cancelled", [{"url": "https://a.tn"}], status="completed") is False
+
+    task = _get_task(task_db, "t-cancelled")
+    assert task.status == "cancelled"
+    assert task.results == []
+
+
+class _FakeCoordinator:
+    """Coordinateur sans réseau : les URLs contenant 'vide' ne renvoient rien"""
+
+    def scrape(self, url, **kwargs):
+        if "vide" in url:
+            return None
+        return SimpleNamespace(
+            structured_data={"extracted_values": {"pib": 1.0}},
+            metadata={"smart_coordinator": {"strategy_used": "traditional"}},
+            raw_content="<html></html>"
+        )
+
+
+@pytest.fixture
+def eager_celery(monkeypatch):
+    """Exécution synchrone des tâches et du chord"""
+    celery_app = scraping_tasks.get_celery_app()
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+    monkeypatch.setattr(celery_app.conf, "task_eager_propagates", True)
+    return celery_app
+
+
+def test_scrape_url_task_returns_failure_dict(task_db, eager_celery, monkeypatch):
+    """Exception inattendue (coordinateur indisponible) : résultat en échec, pas d'exception"""
+    def broken_coordinator():
+        raise RuntimeError("coordinator down")
+    monkeypatch.setattr(scraping_tasks, "_get_coordinator", broken_coordinator)
+
+    result = scraping_tasks.scrape_url_task.apply(args=("https://a.tn",)).get()
+
+    assert result["success"] is False
+    assert result["status_code"] == 500
+    assert result["error"] == "coordinator down"
+
+
+def test_dispatch_scraping_chord_finalizes_task(task_db, eager_celery, monkeypatch):
+    """Chord : une sous-tâche par URL, résultats dans l'ordre des URLs et métriques finales"""
+    monkeypatch.setattr(scraping_tasks, "_get_coordinator", _FakeCoordinator)
+    _add_task(task_db, "t-chord", status="pending")
+    urls = ["https://a.tn", "https://vide.tn", "https://b.tn"]
+
+    scraping_tasks.dispatch_scraping_chord("t-chord", urls)
+
+    task = _get_task(task_db, "t-chord")
+    assert task.status == "completed"
+    assert [result["url"] for result in task.results] == urls
+    assert [result["url_index"] for result in task.results] == [0, 1, 2]
+    assert [result["success"] for result in task.results] == [True, False, True]
+    assert task.metrics["successful_urls"] == 2
+    assert task.metrics["strategy_distribution"] == {"traditional": 2, "intelligent": 0}
+
+
+def test_chord_errback_marks_task_failed(task_db):
+    """Errback du chord : la tâche passe en 'failed' avec l'erreur"""
+    _add_task(task_db, "t-errback", status="running")
+
+    scraping_tasks.scraping_chord_error_task(None, RuntimeError("finalize crashed"), None, task_id="t-errback")
+
+    task = _get_task(task_db, "t-errback")
+    assert task.status == "failed"
+    assert "finalize crashed" in task.error
+
+
+def test_cleanup_task_purges_old_finished_tasks(task_db, eager_celery):
+    """Purge planifiée : seules les tâches terminées plus anciennes que la rétention sont supprimées"""
+    old = datetime.utcnow() - timedelta(days=45)
+    _add_task(task_db, "t-old-done", status="completed", created_at=old)
+    _add_task(task_db, "t-old-failed", status="failed", created_at=old)
+    _add_task(task_db, "t-old-running", status="running", created_at=old)
+    _add_task(task_db, "t-recent-done", status="completed")
+
+    result = scraping_tasks.cleanup_old_tasks_task.apply(kwargs={"older_than_days": 30}).get()
+
+    assert result["deleted_count"] == 2
+    assert "error" not in result
+    task_db.expire_all()
+    remaining = {task.task_id for task in task_db.query(ScrapingTask).all()}
+    assert remaining == {"t-old-running", "t-recent-done"}
+
+
+def test_cleanup_old_tasks_batches(task_db):
+    """Lots plus petits que le nombre de tâches : toutes les tâches anciennes sont purgées"""
+    old = datetime.utcnow() - timedelta(days=45)
+    for index in range(5):
+        _add_task(task_db, f"t-batch-{index}", status="completed", created_at=old)
+
+    result = database.cleanup_old_tasks(older_than_days=30, batch_size=2)
+
+    assert result["deleted_count"] == 5
+    task_db.expire_all()
+    assert task_db.query(ScrapingTask).count() == 0
+
+
+def test_claim_is_exclusive_while_running(task_db):
+    """Deux livraisons du même message : seule la première prend la tâche"""
+    _add_task(task_db, "t-claim", status="pending")
+
+    assert scraping_tasks._claim_task("t-claim", 600, status="running", started_at=datetime.utcnow()) is True
+    assert scraping_tasks._claim_task("t-claim", 600, status="running", started_at=datetime.utcnow()) is False
+
+
+def test_claim_takes_over_stale_running_task(task_db):
+    """Exécution précédente tuée (démarrée avant la limite dure) : la redélivrance reprend la tâche"""
+    _add_task(task_db, "t-stale", status="running", started_at=datetime.utcnow() - timedelta(seconds=700))
+    _add_task(task_db, "t-failed", status="failed")
+    _add_task(task_db, "t-done", status="completed", started_at=datetime.utcnow() - timedelta(seconds=700))
+
+    assert scraping_tasks._claim_task("t-stale", 600, status="running", started_at=datetime.utcnow()) is True
+    assert scraping_tasks._claim_task("t-failed", 600, status="running", started_at=datetime.utcnow()) is True
+    assert scraping_tasks._claim_task("t-done", 600, status="running", started_at=datetime.utcnow()) is False
+
+
+def test_soft_time_limit_during_progress_write_finalizes_task(task_db, eager_celery, monkeypatch):
+    """Limite souple levée pendant l'écriture de progression : pas avalée, résultats partiels finalisés"""
+    from celery.exceptions import SoftTimeLimitExceeded
+
+    def soft_limit(*args, **kwargs):
+        raise SoftTimeLimitExceeded()
+    monkeypatch.setattr(scraping_tasks, "_get_coordinator", _FakeCoordinator)
+    monkeypatch.setattr(scraping_tasks, "_append_task_results", soft_limit)
+    _add_task(task_db, "t-soft", status="pending")
+
+    result = scraping_tasks.smart_scraping_task.apply(
+        kwargs={"task_id": "t-soft", "urls": ["https://a.tn"]}
+    ).get()
+
+    assert result["status"] == "completed"
+    assert result["metrics"]["corrections_metadata"]["soft_time_limit_reached"] is True
+    task = _get_task(task_db, "t-soft")
+    assert task.status == "completed"
+    assert [item["url"] for item in task.results] == ["https://a.tn"]
+
+
+def test_orjson_wire_serializer_rejects_non_json_payloads():
+    """Sérialiseur des messages : un objet non JSON lève une erreur au lieu d'être converti en str"""
+    from kombu.exceptions import EncodeError
+    from kombu.serialization import dumps
+
+    from app import celery_app
+
+    if not celery_app.ORJSON_SERIALIZER_AVAILABLE:
+        pytest.skip("orjson indisponible")
+    assert dumps({"value": datetime(2024, 1, 1)}, serializer="orjson")[2] == '{"value":"2024-01-01T00:00:00"}'
+    with pytest.raises(EncodeError):
+        dumps({"value": object()}, serializer="orjson")
@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("requests")
+
+from app.scrapers import traditional
+from app.scrapers.traditional import _decode_body
+
+
+def test_undecodable_bytes_are_replaced_not_dropped():
+    """Octet latin-1 déclaré UTF-8 : remplacé par U+FFFD, le nombre n'est pas recollé"""
+    assert _decode_body(b'12\xa0345', 'utf-8') == '12�345'
+
+
+def test_missing_charset_is_detected_on_the_slice():
+    """Sans charset annoncé : détection sur les octets lus (latin-1 ici)"""
+    if not traditional.CHARSET_NORMALIZER_AVAILABLE:
+        pytest.skip("charset_normalizer indisponible")
+    assert _decode_body(b'Inflation : 12\xa0345 dinars en 2023', None) == 'Inflation : 12\xa0345 dinars en 2023'
+
+
+def test_unknown_encoding_falls_back_to_utf8():
+    """Encodage annoncé inconnu : repli UTF-8 avec remplacement"""
+    assert _decode_body('Déficit'.encode('utf-8'), 'x-unknown') == 'Déficit'